@@ -29,9 +29,13 @@ __version__ = "0.2.0"
 __author__ = "Audio to MIDI Translator"
 __email__ = "user@example.com"
 
-from .core.application import AudioToMidiApp
+from typing import TYPE_CHECKING, Any, List
+
 from .core.exceptions import AudioError, ConfigError, MidiError, AudioToMidiError
 
+if TYPE_CHECKING:
+    from .core.application import AudioToMidiApp
+
 __all__ = [
     "AudioToMidiApp",
     "AudioToMidiError",
@@ -39,3 +43,16 @@ __all__ = [
     "MidiError",
     "ConfigError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Import the application (and its audio/MIDI stack) on first access only
+    if name == "AudioToMidiApp":
+        from .core.application import AudioToMidiApp
+
+        return AudioToMidiApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
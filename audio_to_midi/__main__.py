@@ -0,0 +1,11 @@
+"""
+Module entry point for the Audio to MIDI application.
+
+Allows running the application with ``python -m audio_to_midi`` or from a
+zipapp built with ``make zipapp``.
+"""
+
+from .main import main
+
+if __name__ == "__main__":
+    main()
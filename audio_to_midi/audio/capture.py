@@ -6,16 +6,20 @@ with configurable parameters and error handling.
 """
 
 import logging
-import queue
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 
 import numpy as np
 import pyaudio
 
 from ..core.exceptions import AudioError
+from ..core.ringbuffer import SPSCRing
 
 logger = logging.getLogger(__name__)
 
+# Chunks buffered between the stream callback and the reader; beyond this the
+# callback drops new chunks instead of letting a lagging reader fall behind
+MAX_QUEUED_CHUNKS = 32
+
 
 class AudioCapture:
     """
@@ -36,13 +40,28 @@ class AudioCapture:
         >>> capture.stop()
     """
 
-    def __init__(self) -> None:
-        """Initialize the audio capture."""
-        self._audio = None
+    def __init__(self, audio: Optional[pyaudio.PyAudio] = None) -> None:
+        """
+        Initialize the audio capture.
+
+        Args:
+            audio: PyAudio instance to share, e.g. the device manager's; it is
+                not terminated on close(). None creates a private instance.
+        """
+        # Initializing PortAudio rescans every host API, so it is worth
+        # sharing one instance instead of creating one per component
+        self._audio = audio
+        self._owns_audio = audio is None
         self._stream = None
         self._is_capturing = False
         self._capture_thread = None
-        self._audio_queue: queue.Queue = queue.Queue()
+
+        # Chunks are copied into preallocated slots and only slot indices are
+        # queued; one spare slot is the one the reader is copying out of
+        self._audio_queue = SPSCRing(MAX_QUEUED_CHUNKS)
+        self._slots = np.zeros((0, 0), dtype=np.float32)
+        self._slot_lengths: List[int] = []
+        self._next_slot = 0
 
         # Configuration
         self.sample_rate = 44100
@@ -55,7 +74,8 @@ class AudioCapture:
         self.on_audio_data: Optional[Callable] = None
         self.on_error: Optional[Callable] = None
 
-        self._initialize_audio()
+        if self._owns_audio:
+            self._initialize_audio()
 
     def _initialize_audio(self) -> None:
         """Initialize PyAudio."""
@@ -115,6 +135,13 @@ class AudioCapture:
             logger.warning("Audio capture already started")
             return
 
+        # Allocate the chunk slots up front so the callback never allocates
+        slot_size = self.chunk_size * self.channels
+        if self._slots.shape != (MAX_QUEUED_CHUNKS + 1, slot_size):
+            self._slots = np.zeros((MAX_QUEUED_CHUNKS + 1, slot_size), np.float32)
+            self._slot_lengths = [0] * (MAX_QUEUED_CHUNKS + 1)
+        self._next_slot = 0
+
         try:
             # Open audio stream
             self._stream = self._audio.open(
@@ -155,35 +182,46 @@ class AudioCapture:
             except Exception as e:
                 logger.error(f"Error stopping audio stream: {e}")
 
-        # Clear the queue
-        while not self._audio_queue.empty():
-            try:
-                self._audio_queue.get_nowait()
-            except queue.Empty:
-                break
+        # Discard queued chunks; a fresh ring avoids popping from this thread
+        # while the reader may still be popping from its own
+        self._audio_queue = SPSCRing(MAX_QUEUED_CHUNKS)
 
         logger.info("Audio capture stopped")
 
-    def get_audio_data(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+    def get_audio_data(
+        self,
+        timeout: Optional[float] = None,
+        out: Optional[np.ndarray] = None,
+        copy: bool = True,
+    ) -> Optional[np.ndarray]:
         """
         Get the next audio data chunk.
 
         Args:
             timeout: Timeout in seconds (None for blocking)
+            out: Optional preallocated buffer to copy the chunk into; used
+                only when its shape matches the chunk
+            copy: When False (and out is not used), return a read-only view
+                of the captured chunk instead of a copy. The view stays valid
+                until the next call, since the callback only reuses a slot
+                after the reader has popped a later one
 
         Returns:
-            Audio data as numpy array, or None if no data available
+            Audio data as numpy array (out when it was filled, otherwise a
+            copy or view), or None if no data available
         """
         try:
-            if timeout is None:
-                audio_data = self._audio_queue.get()
-            else:
-                audio_data = self._audio_queue.get(timeout=timeout)
-            if isinstance(audio_data, np.ndarray):
+            slot = self._audio_queue.pop(timeout=timeout)
+            if slot is None:
+                return None
+            audio_data = self._slots[slot, : self._slot_lengths[slot]]
+            if out is not None and out.shape == audio_data.shape:
+                np.copyto(out, audio_data)
+                return out
+            if not copy:
+                audio_data.flags.writeable = False
                 return audio_data
-            return None
-        except queue.Empty:
-            return None
+            return audio_data.copy()
         except Exception as e:
             logger.error(f"Error getting audio data: {e}")
             return None
@@ -193,12 +231,20 @@ class AudioCapture:
     ) -> tuple:
         """PyAudio stream callback."""
         try:
-            # Convert audio data to numpy array
+            # View the audio data as a numpy array (no copy)
             audio_data = np.frombuffer(in_data, dtype=np.float32)
 
-            # Put in queue for processing
-            if not self._audio_queue.full():
-                self._audio_queue.put(audio_data)
+            # Copy into the next free slot and queue its index, dropping the
+            # chunk if the reader lags
+            if len(self._audio_queue) < MAX_QUEUED_CHUNKS:
+                slot = self._next_slot
+                length = min(len(audio_data), self._slots.shape[1])
+                self._slots[slot, :length] = audio_data[:length]
+                self._slot_lengths[slot] = length
+                self._audio_queue.try_push(slot)
+                self._next_slot = (slot + 1) % len(self._slots)
+            else:
+                logger.debug("Audio queue full, dropping chunk")
 
             # Call callback if provided
             if self.on_audio_data:
@@ -242,9 +288,10 @@ class AudioCapture:
         self.stop()
 
         if self._audio:
-            self._audio.terminate()
+            if self._owns_audio:
+                self._audio.terminate()
+                logger.debug("PyAudio terminated")
             self._audio = None
-            logger.debug("PyAudio terminated")
 
     @property
     def is_capturing(self) -> bool:
@@ -254,7 +301,7 @@ class AudioCapture:
     @property
     def queue_size(self) -> int:
         """Get current audio queue size."""
-        return self._audio_queue.qsize()
+        return len(self._audio_queue)
 
     def __del__(self) -> None:
         """Destructor to clean up resources."""
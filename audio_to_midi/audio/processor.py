@@ -6,10 +6,11 @@ and silence detection before pitch analysis.
 """
 
 import logging
-from typing import Tuple, cast
+from typing import Dict, Optional, Tuple, cast
 
 import numpy as np
 from scipy import signal
+from scipy.fft import rfft, rfftfreq
 
 from ..core.exceptions import AudioError
 
@@ -45,6 +46,25 @@ class AudioProcessor:
         # State for filtering
         self._filter_state = None
 
+        # (window type, length) -> window, built once per chunk size
+        self._windows: Dict[Tuple[str, int], np.ndarray] = {}
+
+        # Spectrum length -> bin frequencies, rebuilt when the rate changes
+        self._spectrum_frequencies: Dict[int, np.ndarray] = {}
+
+        # Decimation (anti-alias filter state and sample phase persist across
+        # chunks so block edges do not introduce artifacts)
+        self.decimation = 1
+        self._decimation_b = None
+        self._decimation_a = None
+        self._decimation_state = None
+        self._decimation_phase = 0
+
+        # Rolling analysis window (filtered, decimated samples); None analyzes
+        # each chunk on its own
+        self.analysis_size = 0
+        self._history: Optional[np.ndarray] = None
+
         logger.debug("Audio processor initialized")
 
     def configure(
@@ -54,6 +74,8 @@ class AudioProcessor:
         window_type: str = "hann",
         apply_high_pass: bool = True,
         high_pass_freq: float = 50.0,
+        decimation: int = 1,
+        analysis_size: int = 0,
     ) -> None:
         """
         Configure audio processing parameters.
@@ -61,9 +83,16 @@ class AudioProcessor:
         Args:
             sample_rate: Sample rate in Hz
             silence_threshold: Threshold for silence detection
-            window_type: Window function type ('hann', 'hamming', 'blackman')
+            window_type: Window function type ('hann', 'hamming', 'blackman'),
+                or 'none' to analyze the data unwindowed
             apply_high_pass: Whether to apply high-pass filtering
             high_pass_freq: High-pass filter cutoff frequency
+            decimation: Integer downsampling factor applied before windowing;
+                processed data is at output_sample_rate
+            analysis_size: Input samples analyzed per chunk; when larger than
+                the chunk size, each chunk is appended to a rolling window of
+                this length so successive analyses overlap (0 analyzes each
+                chunk on its own)
 
         Raises:
             AudioError: If configuration is invalid
@@ -72,20 +101,34 @@ class AudioProcessor:
             raise AudioError("Sample rate must be positive")
         if silence_threshold < 0:
             raise AudioError("Silence threshold must be non-negative")
-        if high_pass_freq <= 0 or high_pass_freq >= sample_rate / 2:
+        if decimation < 1:
+            raise AudioError("Decimation factor must be at least 1")
+        # The high-pass filter runs after decimation, at the output rate
+        if high_pass_freq <= 0 or high_pass_freq >= sample_rate / decimation / 2:
             raise AudioError(
                 "High-pass frequency must be between 0 and Nyquist frequency"
             )
+        if analysis_size < 0:
+            raise AudioError("Analysis size must be non-negative")
 
         self.sample_rate = sample_rate
         self.silence_threshold = silence_threshold
         self.window_type = window_type
         self.apply_high_pass = apply_high_pass
         self.high_pass_freq = high_pass_freq
+        self.decimation = decimation
+        self.analysis_size = analysis_size
+        self._history = (
+            np.zeros((analysis_size + decimation - 1) // decimation)
+            if analysis_size
+            else None
+        )
 
         # Design high-pass filter if needed
         if self.apply_high_pass:
             self._design_high_pass_filter()
+        self._design_decimation_filter()
+        self._spectrum_frequencies.clear()
 
         logger.info(
             f"Audio processor configured: {sample_rate}Hz, threshold={silence_threshold}"
@@ -99,7 +142,9 @@ class AudioProcessor:
             audio_data: Input audio data
 
         Returns:
-            Processed audio data
+            Processed audio data. With window_type 'none' this may be the
+            input itself or the rolling analysis window, valid only until the
+            next call
 
         Raises:
             AudioError: If processing fails
@@ -108,12 +153,22 @@ class AudioProcessor:
             raise AudioError("Invalid audio data")
 
         try:
-            processed_data = audio_data.copy()
+            # No step below modifies the input, so it needs no defensive copy
+            processed_data = audio_data
+
+            # Downsample first so pitch detection and the high-pass filter see
+            # fewer samples
+            if self.decimation > 1:
+                processed_data = self._decimate(processed_data)
 
             # Apply high-pass filter if configured
             if self.apply_high_pass and self._filter_b is not None:
                 processed_data = self._apply_high_pass_filter(processed_data)
 
+            # Analyze the latest analysis_size samples rather than the chunk
+            if self._history is not None:
+                processed_data = self._append_history(processed_data)
+
             # Apply windowing
             processed_data = self._apply_window(processed_data)
 
@@ -122,6 +177,11 @@ class AudioProcessor:
         except Exception as e:
             raise AudioError(f"Audio processing failed: {e}")
 
+    @property
+    def output_sample_rate(self) -> float:
+        """Sample rate of the data returned by process()."""
+        return self.sample_rate / self.decimation
+
     def is_silent(self, audio_data: np.ndarray) -> bool:
         """
         Check if audio data is silent.
@@ -135,9 +195,27 @@ class AudioProcessor:
         if audio_data is None or len(audio_data) == 0:
             return True
 
-        # Use peak level for silence detection
-        peak_level: float = float(np.max(np.abs(audio_data)))
-        return peak_level < self.silence_threshold
+        # Use peak level for silence detection; max/min avoid allocating an
+        # abs() copy of the chunk
+        peak_level = max(audio_data.max(), -audio_data.min())
+        return bool(peak_level < self.silence_threshold)
+
+    def clear_history(self) -> None:
+        """
+        Forget audio from before a silent stretch.
+
+        Chunks skipped by the silence gate never reach the filters, so their
+        state and the decimation phase would otherwise carry over from the
+        last voiced chunk and add a transient to the next onset. Filters
+        restart from rest, which matches the near-silent input they skipped.
+        """
+        if self._history is not None:
+            self._history.fill(0.0)
+        if self._filter_state is not None:
+            self._filter_state.fill(0.0)
+        if self._decimation_state is not None:
+            self._decimation_state.fill(0.0)
+        self._decimation_phase = 0
 
     def get_audio_level(self, audio_data: np.ndarray) -> float:
         """
@@ -152,7 +230,8 @@ class AudioProcessor:
         if audio_data is None or len(audio_data) == 0:
             return 0.0
 
-        return float(np.sqrt(np.mean(audio_data**2)))
+        # dot() sums the squares in one pass without a temporary array
+        return float(np.sqrt(np.dot(audio_data, audio_data) / len(audio_data)))
 
     def get_peak_level(self, audio_data: np.ndarray) -> float:
         """
@@ -167,7 +246,7 @@ class AudioProcessor:
         if audio_data is None or len(audio_data) == 0:
             return 0.0
 
-        return float(np.max(np.abs(audio_data)))
+        return float(max(audio_data.max(), -audio_data.min()))
 
     def normalize_audio(
         self, audio_data: np.ndarray, target_level: float = 0.5
@@ -196,7 +275,7 @@ class AudioProcessor:
         """Design high-pass filter coefficients."""
         try:
             # Design a 2nd order Butterworth high-pass filter
-            nyquist = self.sample_rate / 2
+            nyquist = self.output_sample_rate / 2
             normalized_freq = self.high_pass_freq / nyquist
 
             self._filter_b, self._filter_a = signal.butter(
@@ -227,17 +306,67 @@ class AudioProcessor:
             logger.error(f"High-pass filtering failed: {e}")
             return cast(np.ndarray, np.copy(audio_data))
 
+    def _design_decimation_filter(self) -> None:
+        """Design the anti-aliasing filter used before downsampling."""
+        self._decimation_phase = 0
+        if self.decimation == 1:
+            self._decimation_b = None
+            self._decimation_a = None
+            self._decimation_state = None
+            return
+
+        # Same Chebyshev type I design scipy.signal.decimate uses for 'iir';
+        # lfilter has far less per-call overhead than sosfilt on short chunks
+        self._decimation_b, self._decimation_a = signal.cheby1(
+            8, 0.05, 0.8 / self.decimation
+        )
+        self._decimation_state = np.zeros(len(self._decimation_a) - 1)
+        logger.debug(f"Decimation filter designed: factor {self.decimation}")
+
+    def _decimate(self, audio_data: np.ndarray) -> np.ndarray:
+        """Low-pass filter and downsample audio data by the decimation factor."""
+        filtered_data, self._decimation_state = signal.lfilter(
+            self._decimation_b,
+            self._decimation_a,
+            audio_data,
+            zi=self._decimation_state,
+        )
+        # Keep every decimation-th sample of the continuous stream, even when
+        # the chunk size is not a multiple of the factor
+        decimated = filtered_data[self._decimation_phase :: self.decimation]
+        self._decimation_phase = (
+            self._decimation_phase - len(audio_data)
+        ) % self.decimation
+        return cast(np.ndarray, decimated)
+
+    def _append_history(self, audio_data: np.ndarray) -> np.ndarray:
+        """Shift audio data into the rolling analysis window and return it."""
+        history = cast(np.ndarray, self._history)
+        count = len(audio_data)
+        if count >= len(history):
+            history[:] = audio_data[len(audio_data) - len(history) :]
+        elif count:
+            history[:-count] = history[count:]
+            history[-count:] = audio_data
+        return history
+
     def _apply_window(self, audio_data: np.ndarray) -> np.ndarray:
         """Apply windowing to audio data."""
+        if self.window_type == "none":
+            return audio_data
         try:
-            if self.window_type == "hann":
-                window = np.hanning(len(audio_data))
-            elif self.window_type == "hamming":
-                window = np.hamming(len(audio_data))
-            elif self.window_type == "blackman":
-                window = np.blackman(len(audio_data))
-            else:
-                return cast(np.ndarray, np.copy(audio_data))
+            key = (self.window_type, len(audio_data))
+            window = self._windows.get(key)
+            if window is None:
+                if self.window_type == "hann":
+                    window = np.hanning(len(audio_data))
+                elif self.window_type == "hamming":
+                    window = np.hamming(len(audio_data))
+                elif self.window_type == "blackman":
+                    window = np.blackman(len(audio_data))
+                else:
+                    return cast(np.ndarray, np.copy(audio_data))
+                self._windows[key] = window
             return cast(np.ndarray, audio_data * window)
         except Exception as e:
             logger.error(f"Windowing failed: {e}")
@@ -253,16 +382,21 @@ class AudioProcessor:
             audio_data: Audio data
 
         Returns:
-            Tuple of (frequencies, magnitudes)
+            Tuple of (frequencies, magnitudes); frequencies is a read-only
+            array shared between calls with the same length
         """
         if audio_data is None or len(audio_data) == 0:
             return np.zeros(0, dtype=float), np.zeros(0, dtype=float)
 
         try:
             # Compute FFT
-            fft = np.fft.rfft(audio_data)
-            magnitudes = np.abs(fft)
-            frequencies = np.fft.rfftfreq(len(audio_data), 1.0 / self.sample_rate)
+            magnitudes = np.abs(rfft(audio_data))
+            frequencies = self._spectrum_frequencies.get(len(audio_data))
+            if frequencies is None:
+                frequencies = rfftfreq(len(audio_data), 1.0 / self.sample_rate)
+                # Shared between calls, so callers must not modify it
+                frequencies.flags.writeable = False
+                self._spectrum_frequencies[len(audio_data)] = frequencies
             return frequencies, magnitudes
         except Exception as e:
             logger.error(f"Frequency spectrum calculation failed: {e}")
@@ -281,7 +415,7 @@ class AudioProcessor:
         """
         if audio_data is None or len(audio_data) == 0:
             return False
-        return bool(np.any(np.abs(audio_data) >= threshold))
+        return bool(max(audio_data.max(), -audio_data.min()) >= threshold)
 
     def get_processing_info(self) -> dict:
         """
@@ -296,4 +430,6 @@ class AudioProcessor:
             "window_type": self.window_type,
             "apply_high_pass": self.apply_high_pass,
             "high_pass_freq": self.high_pass_freq,
+            "decimation": self.decimation,
+            "analysis_size": self.analysis_size,
         }
@@ -5,39 +5,86 @@ This module defines all CLI commands using Click with enhanced error handling,
 validation, and user interaction through Rich interfaces.
 """
 
+import dataclasses
+import functools
 import logging
 import sys
+from contextlib import ExitStack
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional
 
 import click
-from rich.console import Console
 
-from ..audio.capture import AudioCapture
-from ..audio.processor import AudioProcessor
-from ..config import ConfigManager
-from ..config.settings import Settings
-from ..core.application import AudioToMidiApp
 from ..core.exceptions import ConfigError, AudioToMidiError
-from ..devices.audio_devices import AudioDeviceManager
-from ..devices.midi_devices import MidiDeviceManager
-from ..midi.output import MidiOutput
-from ..pitch.detector import PitchDetector
-from .interface import CLIInterface
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from ..config.settings import Settings
+    from ..devices.audio_devices import AudioDevice
+    from ..devices.midi_devices import MidiPort
+    from .interface import CLIInterface
 
 logger = logging.getLogger(__name__)
-console = Console()
+
+
+@functools.lru_cache(maxsize=None)
+def _console() -> "Console":
+    """Create the shared Rich console on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+@functools.lru_cache(maxsize=None)
+def _field_names(section_type: type) -> FrozenSet[str]:
+    """Return the dataclass field names of a settings section type."""
+    return frozenset(field.name for field in dataclasses.fields(section_type))
+
+
+class ChunkSizeType(click.ParamType):
+    """Click parameter type accepting the supported audio chunk sizes as ints."""
+
+    name = "chunk_size"
+    choices = (512, 1024, 2048, 4096)
+
+    def convert(
+        self,
+        value: Any,
+        param: Optional[click.Parameter],
+        ctx: Optional[click.Context],
+    ) -> int:
+        try:
+            chunk_size = int(value)
+        except (TypeError, ValueError):
+            self.fail(f"{value!r} is not an integer", param, ctx)
+        if chunk_size not in self.choices:
+            choices = ", ".join(str(choice) for choice in self.choices)
+            self.fail(f"{chunk_size} is not one of {choices}", param, ctx)
+        return chunk_size
+
+
+def _snapshot(section: Any) -> Dict[str, Any]:
+    """Return a detached copy of a settings section for interactive editing."""
+    return dataclasses.asdict(section)
+
+
+def _apply_section_updates(section: Any, updates: Dict[str, Any]) -> None:
+    """Copy known fields from an interactive configurator result onto a section."""
+    allowed = _field_names(type(section))
+    for key in updates.keys() & allowed:
+        setattr(section, key, updates[key])
 
 
 def _configure_basic_settings(
-    cli_interface: CLIInterface,
-    settings: Settings,
-    audio_device_manager: AudioDeviceManager,
-    midi_device_manager: MidiDeviceManager,
+    cli_interface: "CLIInterface",
+    settings: "Settings",
+    audio_devices: List["AudioDevice"],
+    midi_ports: List["MidiPort"],
 ) -> None:
     """Configure basic settings: audio input and MIDI output devices."""
     cli_interface.display_header("Basic Settings")
 
     # Configure audio device
-    audio_devices = audio_device_manager.list_input_devices()
     audio_device = cli_interface.select_audio_device(
         audio_devices,
         default_index=settings.audio.input_device_index,
@@ -49,7 +96,6 @@ def _configure_basic_settings(
         cli_interface.display_success(f"Audio device set to: {audio_device.name}")
 
     # Configure MIDI port
-    midi_ports = midi_device_manager.list_output_ports()
     midi_port = cli_interface.select_midi_port(
         midi_ports,
         default_index=settings.midi.output_port_index,
@@ -62,33 +108,27 @@ def _configure_basic_settings(
 
 
 def _configure_advanced_settings(
-    cli_interface: CLIInterface, settings: Settings
+    cli_interface: "CLIInterface", settings: "Settings"
 ) -> None:
     """Configure advanced settings: audio, MIDI, and pitch detection parameters."""
     cli_interface.display_header("Advanced Settings")
 
     # Audio settings
     cli_interface.display_info("Configuring audio processing settings...")
-    audio_settings = cli_interface.configure_audio_settings(settings.audio.__dict__)
-    for key, value in audio_settings.items():
-        if hasattr(settings.audio, key):
-            setattr(settings.audio, key, value)
+    audio_settings = cli_interface.configure_audio_settings(_snapshot(settings.audio))
+    _apply_section_updates(settings.audio, audio_settings)
     cli_interface.display_success("Audio settings updated")
 
     # MIDI settings
     cli_interface.display_info("Configuring MIDI output settings...")
-    midi_settings = cli_interface.configure_midi_settings(settings.midi.__dict__)
-    for key, value in midi_settings.items():
-        if hasattr(settings.midi, key):
-            setattr(settings.midi, key, value)
+    midi_settings = cli_interface.configure_midi_settings(_snapshot(settings.midi))
+    _apply_section_updates(settings.midi, midi_settings)
     cli_interface.display_success("MIDI settings updated")
 
     # Pitch detection settings
     cli_interface.display_info("Configuring pitch detection settings...")
-    pitch_settings = cli_interface.configure_pitch_settings(settings.pitch.__dict__)
-    for key, value in pitch_settings.items():
-        if hasattr(settings.pitch, key):
-            setattr(settings.pitch, key, value)
+    pitch_settings = cli_interface.configure_pitch_settings(_snapshot(settings.pitch))
+    _apply_section_updates(settings.pitch, pitch_settings)
     cli_interface.display_success("Pitch detection settings updated")
 
 
@@ -113,13 +153,18 @@ def cli(verbose: bool) -> None:
     voice-to-midi config --advanced      # Configure all settings
     voice-to-midi list                   # Show available devices
     """
+    # Nothing to log for bare help or shell completion
+    ctx = click.get_current_context()
+    if ctx.invoked_subcommand is None or ctx.resilient_parsing:
+        return
+
     # Configure logging
     from ..utils.helpers import setup_logging
 
     level = "DEBUG" if verbose else "INFO"
     setup_logging(level)
 
-    logger.info("Audio to MIDI application starting")
+    logger.debug("Audio to MIDI application starting")
 
 
 @cli.command("run")
@@ -129,23 +174,27 @@ def cli(verbose: bool) -> None:
 @click.option(
     "-t",
     "--transpose",
-    type=int,
+    type=click.IntRange(-24, 24),
     help="Transpose output in semitones (e.g., -12 for one octave down)",
 )
 @click.option(
-    "--min-freq", type=float, help="Minimum frequency for pitch detection (Hz)"
+    "--min-freq",
+    type=click.FloatRange(min=0.0, min_open=True),
+    help="Minimum frequency for pitch detection (Hz)",
 )
 @click.option(
-    "--max-freq", type=float, help="Maximum frequency for pitch detection (Hz)"
+    "--max-freq",
+    type=click.FloatRange(min=0.0, min_open=True),
+    help="Maximum frequency for pitch detection (Hz)",
 )
 @click.option(
     "--chunk-size",
-    type=click.Choice(["512", "1024", "2048", "4096"]),
-    help="Audio chunk size (affects latency and frequency resolution)",
+    type=ChunkSizeType(),
+    help="Audio chunk size: 512, 1024, 2048 or 4096 (affects latency and frequency resolution)",
 )
 @click.option(
     "--confidence",
-    type=float,
+    type=click.FloatRange(0.0, 1.0),
     help="Confidence threshold for pitch detection (0.0-1.0)",
 )
 @click.option("--config-path", type=click.Path(), help="Path to configuration file")
@@ -154,7 +203,7 @@ def run_app(
     transpose: int,
     min_freq: float,
     max_freq: float,
-    chunk_size: str,
+    chunk_size: Optional[int],
     confidence: float,
     config_path: str,
 ) -> None:
@@ -171,131 +220,139 @@ def run_app(
         voice-to-midi run -t -12             # Transpose down one octave
         voice-to-midi run --chunk-size 2048  # Use larger chunk size
     """
-    cli_interface = CLIInterface()
+    from ..audio.capture import AudioCapture
+    from ..audio.processor import AudioProcessor
+    from ..core.application import AudioToMidiApp
+    from ..devices.audio_devices import AudioDeviceManager
+    from ..devices.midi_devices import MidiDeviceManager
+    from ..midi.output import MidiOutput
+    from ..pitch.detector import PitchDetector
+    from .interface import CLIInterface
 
-    try:
-        # Create and configure application
-        app = AudioToMidiApp(config_path)
+    cli_interface = CLIInterface()
 
-        # Load configuration
+    with ExitStack() as stack:
         try:
-            settings = app.load_config()
-        except ConfigError as e:
-            cli_interface.display_error(f"Configuration error: {e}")
-            sys.exit(1)
+            # Create and configure application
+            app = AudioToMidiApp(config_path)
+
+            # Load configuration
+            try:
+                settings = app.load_config()
+            except ConfigError as e:
+                cli_interface.display_error(f"Configuration error: {e}")
+                sys.exit(1)
+
+            # Override settings with command line options
+            if transpose is not None:
+                settings.midi.transpose_semitones = transpose
+            if min_freq is not None:
+                settings.pitch.min_freq = min_freq
+            if max_freq is not None:
+                settings.pitch.max_freq = max_freq
+            if chunk_size is not None:
+                settings.audio.chunk_size = chunk_size
+            if confidence is not None:
+                settings.pitch.confidence_threshold = confidence
+
+            # Create and inject dependencies
+            audio_device_manager = AudioDeviceManager()
+            stack.callback(audio_device_manager.close)
+            midi_device_manager = MidiDeviceManager()
+            stack.callback(midi_device_manager.close)
+            # Share the device manager's PortAudio session rather than
+            # initializing (and rescanning devices) a second time
+            audio_capture = AudioCapture(audio=audio_device_manager.audio)
+            audio_processor = AudioProcessor()
+            pitch_detector = PitchDetector()
+            midi_output = MidiOutput()
+
+            app.inject_dependencies(
+                audio_device_manager=audio_device_manager,
+                midi_device_manager=midi_device_manager,
+                audio_capture=audio_capture,
+                audio_processor=audio_processor,
+                pitch_detector=pitch_detector,
+                midi_output=midi_output,
+            )
 
-        # Override settings with command line options
-        if transpose is not None:
-            settings.midi.transpose_semitones = transpose
-        if min_freq is not None:
-            settings.pitch.min_freq = min_freq
-        if max_freq is not None:
-            settings.pitch.max_freq = max_freq
-        if chunk_size is not None:
-            settings.audio.chunk_size = int(chunk_size)
-        if confidence is not None:
-            settings.pitch.confidence_threshold = confidence
-
-        # Create and inject dependencies
-        audio_device_manager = AudioDeviceManager()
-        midi_device_manager = MidiDeviceManager()
-        audio_capture = AudioCapture()
-        audio_processor = AudioProcessor()
-        pitch_detector = PitchDetector()
-        midi_output = MidiOutput()
-
-        app.inject_dependencies(
-            audio_device_manager=audio_device_manager,
-            midi_device_manager=midi_device_manager,
-            audio_capture=audio_capture,
-            audio_processor=audio_processor,
-            pitch_detector=pitch_detector,
-            midi_output=midi_output,
-        )
-
-        # Configure devices
-        try:
-            if choose_devices or not app.is_configured:
-                cli_interface.display_header(
-                    "Audio to MIDI Translator", "Configure your audio and MIDI devices"
+            # Configure devices
+            try:
+                if choose_devices or not app.is_configured:
+                    cli_interface.display_header(
+                        "Audio to MIDI Translator",
+                        "Configure your audio and MIDI devices",
+                    )
+
+                    # Select audio device
+                    audio_devices = audio_device_manager.list_input_devices()
+                    audio_device = cli_interface.select_audio_device(audio_devices)
+                    if not audio_device:
+                        cli_interface.display_error("Audio device selection cancelled")
+                        sys.exit(1)
+
+                    settings.audio.input_device_index = audio_device.index
+                    settings.audio.input_device_name = audio_device.name
+
+                    # Select MIDI port
+                    midi_ports = midi_device_manager.list_output_ports()
+                    midi_port = cli_interface.select_midi_port(midi_ports)
+                    if not midi_port:
+                        cli_interface.display_error("MIDI port selection cancelled")
+                        sys.exit(1)
+
+                    settings.midi.output_port_index = midi_port.index
+                    settings.midi.output_port_name = midi_port.name
+
+                    # Save configuration
+                    app.save_config()
+                    cli_interface.display_success("Configuration saved")
+                else:
+                    cli_interface.display_info(
+                        f"Using audio device: {settings.audio.input_device_name}"
+                    )
+                    cli_interface.display_info(
+                        f"Using MIDI port: {settings.midi.output_port_name}"
+                    )
+
+            except Exception as e:
+                cli_interface.display_error(f"Device configuration failed: {e}")
+                sys.exit(1)
+
+            # Display settings
+            cli_interface.display_configuration_summary(settings.to_dict())
+
+            # Set up event handlers
+            def on_note_change(note: int, frequency: float, confidence: float) -> None:
+                from ..utils.helpers import midi_note_to_name
+
+                note_name = midi_note_to_name(note) if note else "None"
+                cli_interface.display_status(
+                    frequency, note_name, note or 0, confidence
                 )
 
-                # Select audio device
-                audio_devices = audio_device_manager.list_input_devices()
-                audio_device = cli_interface.select_audio_device(audio_devices)
-                if not audio_device:
-                    cli_interface.display_error("Audio device selection cancelled")
-                    sys.exit(1)
+            def on_error(error: Exception) -> None:
+                cli_interface.display_error_panel(error)
 
-                settings.audio.input_device_index = audio_device.index
-                settings.audio.input_device_name = audio_device.name
+            app.on_note_change = on_note_change
+            app.on_error = on_error
 
-                # Select MIDI port
-                midi_ports = midi_device_manager.list_output_ports()
-                midi_port = cli_interface.select_midi_port(midi_ports)
-                if not midi_port:
-                    cli_interface.display_error("MIDI port selection cancelled")
-                    sys.exit(1)
+            # Start the application
+            cli_interface.display_header("Starting Audio to MIDI Conversion")
+            cli_interface.display_info("Speak or sing into your microphone...")
 
-                settings.midi.output_port_index = midi_port.index
-                settings.midi.output_port_name = midi_port.name
-
-                # Save configuration
-                app.save_config()
-                cli_interface.display_success("Configuration saved")
-            else:
-                cli_interface.display_info(
-                    f"Using audio device: {settings.audio.input_device_name}"
-                )
-                cli_interface.display_info(
-                    f"Using MIDI port: {settings.midi.output_port_name}"
-                )
+            app.run()
 
+        except KeyboardInterrupt:
+            cli_interface.display_info("Application stopped by user")
+        except AudioToMidiError as e:
+            cli_interface.display_error_panel(e)
+            sys.exit(1)
         except Exception as e:
-            cli_interface.display_error(f"Device configuration failed: {e}")
+            cli_interface.display_error(f"Unexpected error: {e}")
+            logger.exception("Unexpected error in run command")
             sys.exit(1)
 
-        # Display settings
-        cli_interface.display_configuration_summary(settings.to_dict())
-
-        # Set up event handlers
-        def on_note_change(note: int, frequency: float, confidence: float) -> None:
-            from ..utils.helpers import midi_note_to_name
-
-            note_name = midi_note_to_name(note) if note else "None"
-            cli_interface.display_status(frequency, note_name, note or 0, confidence)
-
-        def on_error(error: Exception) -> None:
-            cli_interface.display_error_panel(error)
-
-        app.on_note_change = on_note_change
-        app.on_error = on_error
-
-        # Start the application
-        cli_interface.display_header("Starting Audio to MIDI Conversion")
-        cli_interface.display_info("Speak or sing into your microphone...")
-
-        app.run()
-
-    except KeyboardInterrupt:
-        cli_interface.display_info("Application stopped by user")
-    except AudioToMidiError as e:
-        cli_interface.display_error_panel(e)
-        sys.exit(1)
-    except Exception as e:
-        cli_interface.display_error(f"Unexpected error: {e}")
-        logger.exception("Unexpected error in run command")
-        sys.exit(1)
-    finally:
-        # Clean up
-        try:
-            if "audio_device_manager" in locals():
-                audio_device_manager.close()
-            if "midi_device_manager" in locals():
-                midi_device_manager.close()
-        except Exception:
-            pass
-
 
 @cli.command("config")
 @click.option("--advanced", is_flag=True, help="Show advanced configuration options")
@@ -322,104 +379,114 @@ def config_command(
     voice-to-midi config --pedal    # Configure MIDI pedal only
     voice-to-midi config --audio    # Configure audio settings only
     """
-    cli_interface = CLIInterface()
+    from ..config import ConfigManager
+    from ..devices.audio_devices import AudioDeviceManager
+    from ..devices.midi_devices import MidiDeviceManager
+    from .interface import CLIInterface
 
-    try:
-        # Create configuration manager
-        config_manager = ConfigManager(config_path)
+    cli_interface = CLIInterface()
 
-        # Load current configuration
+    with ExitStack() as stack:
         try:
-            settings = config_manager.load()
-        except ConfigError as e:
-            cli_interface.display_warning(f"Configuration error: {e}")
-            settings = config_manager.get_settings()
-
-        # Create device managers
-        audio_device_manager = AudioDeviceManager()
-        midi_device_manager = MidiDeviceManager()
-
-        cli_interface.display_header("Audio to MIDI Configuration")
-
-        # Determine configuration mode
-        specific_sections = any([pedal, audio, midi, pitch])
-
-        if not specific_sections:
-            # Default configuration mode
-            if advanced:
-                # Advanced mode: configure all settings
-                cli_interface.display_info(
-                    "Advanced configuration mode - all settings available"
-                )
-                _configure_basic_settings(
-                    cli_interface, settings, audio_device_manager, midi_device_manager
-                )
-                _configure_advanced_settings(cli_interface, settings)
-            else:
-                # Basic mode: configure essential settings only
-                cli_interface.display_info(
-                    "Basic configuration mode - essential settings only"
-                )
-                cli_interface.display_info(
-                    "Use --advanced for additional configuration options"
-                )
-                _configure_basic_settings(
-                    cli_interface, settings, audio_device_manager, midi_device_manager
-                )
-        else:
-            # Specific section configuration
-            if audio:
-                audio_settings = cli_interface.configure_audio_settings(
-                    settings.audio.__dict__
-                )
-                for key, value in audio_settings.items():
-                    if hasattr(settings.audio, key):
-                        setattr(settings.audio, key, value)
-                cli_interface.display_success("Audio settings updated")
-
-            if midi:
-                midi_settings = cli_interface.configure_midi_settings(
-                    settings.midi.__dict__
-                )
-                for key, value in midi_settings.items():
-                    if hasattr(settings.midi, key):
-                        setattr(settings.midi, key, value)
-                cli_interface.display_success("MIDI settings updated")
-
-            if pitch:
-                pitch_settings = cli_interface.configure_pitch_settings(
-                    settings.pitch.__dict__
-                )
-                for key, value in pitch_settings.items():
-                    if hasattr(settings.pitch, key):
-                        setattr(settings.pitch, key, value)
-                cli_interface.display_success("Pitch detection settings updated")
+            # Create configuration manager
+            config_manager = ConfigManager(config_path)
 
-        if pedal:
-            cli_interface.display_pedal_learning_prompt()
-            # TODO: Implement pedal learning
-            cli_interface.display_info("Pedal configuration not yet implemented")
+            # Load current configuration
+            try:
+                settings = config_manager.load()
+            except ConfigError as e:
+                cli_interface.display_warning(f"Configuration error: {e}")
+                settings = config_manager.get_settings()
 
-        # Save configuration
-        config_manager.save()
-        cli_interface.display_success("Configuration saved successfully")
+            original_settings = settings.to_dict()
 
-        # Display summary
-        cli_interface.display_configuration_summary(settings.to_dict())
+            # Create device managers
+            audio_device_manager = AudioDeviceManager()
+            stack.callback(audio_device_manager.close)
+            midi_device_manager = MidiDeviceManager()
+            stack.callback(midi_device_manager.close)
 
-    except Exception as e:
-        cli_interface.display_error_panel(e)
-        logger.exception("Error in config command")
-        sys.exit(1)
-    finally:
-        # Clean up
-        try:
-            if "audio_device_manager" in locals():
-                audio_device_manager.close()
-            if "midi_device_manager" in locals():
-                midi_device_manager.close()
-        except Exception:
-            pass
+            cli_interface.display_header("Audio to MIDI Configuration")
+
+            # Determine configuration mode
+            specific_sections = any([pedal, audio, midi, pitch])
+
+            if not specific_sections:
+                # Enumerate devices once for the basic settings prompts
+                audio_devices = audio_device_manager.list_input_devices()
+                midi_ports = midi_device_manager.list_output_ports()
+
+                # Default configuration mode
+                if advanced:
+                    # Advanced mode: configure all settings
+                    cli_interface.display_info(
+                        "Advanced configuration mode - all settings available"
+                    )
+                    _configure_basic_settings(
+                        cli_interface,
+                        settings,
+                        audio_devices,
+                        midi_ports,
+                    )
+                    _configure_advanced_settings(cli_interface, settings)
+                else:
+                    # Basic mode: configure essential settings only
+                    cli_interface.display_info(
+                        "Basic configuration mode - essential settings only"
+                    )
+                    cli_interface.display_info(
+                        "Use --advanced for additional configuration options"
+                    )
+                    _configure_basic_settings(
+                        cli_interface,
+                        settings,
+                        audio_devices,
+                        midi_ports,
+                    )
+            else:
+                # Specific section configuration
+                if audio:
+                    audio_settings = cli_interface.configure_audio_settings(
+                        _snapshot(settings.audio)
+                    )
+                    _apply_section_updates(settings.audio, audio_settings)
+                    cli_interface.display_success("Audio settings updated")
+
+                if midi:
+                    midi_settings = cli_interface.configure_midi_settings(
+                        _snapshot(settings.midi)
+                    )
+                    _apply_section_updates(settings.midi, midi_settings)
+                    cli_interface.display_success("MIDI settings updated")
+
+                if pitch:
+                    pitch_settings = cli_interface.configure_pitch_settings(
+                        _snapshot(settings.pitch)
+                    )
+                    _apply_section_updates(settings.pitch, pitch_settings)
+                    cli_interface.display_success("Pitch detection settings updated")
+
+            if pedal:
+                cli_interface.display_pedal_learning_prompt()
+                # TODO: Implement pedal learning
+                cli_interface.display_info("Pedal configuration not yet implemented")
+
+            # Save configuration only if something changed
+            updated_settings = settings.to_dict()
+            if config_manager.config_exists and updated_settings == original_settings:
+                logger.info("No configuration changes, skipping save")
+                cli_interface.display_info("No changes to save")
+            else:
+                config_manager.save()
+                cli_interface.display_success("Configuration saved successfully")
+
+            # Display summary
+            cli_interface.display_configuration_summary(updated_settings)
+
+        except Exception as e:
+            cli_interface.display_error_panel(e)
+            logger.exception("Error in config command")
+            sys.exit(1)
 
 
 @cli.command("list")
@@ -430,38 +497,36 @@ def list_devices() -> None:
     This command displays all available audio input devices and MIDI output ports
     on your system. Use this to see what devices are available for configuration.
     """
+    from ..devices.audio_devices import AudioDeviceManager
+    from ..devices.midi_devices import MidiDeviceManager
+    from .interface import CLIInterface
+
     cli_interface = CLIInterface()
 
-    try:
-        # Create device managers
-        audio_device_manager = AudioDeviceManager()
-        midi_device_manager = MidiDeviceManager()
+    with ExitStack() as stack:
+        try:
+            # Create device managers
+            audio_device_manager = AudioDeviceManager()
+            stack.callback(audio_device_manager.close)
+            midi_device_manager = MidiDeviceManager()
+            stack.callback(midi_device_manager.close)
 
-        cli_interface.display_header("Available Devices")
+            cli_interface.display_header("Available Devices")
 
-        # Display audio devices
-        audio_devices = audio_device_manager.list_input_devices()
-        cli_interface.display_audio_devices(audio_devices)
+            # Display audio devices
+            audio_devices = audio_device_manager.list_input_devices()
+            cli_interface.display_audio_devices(audio_devices)
 
-        console.print()
+            _console().print()
 
-        # Display MIDI ports
-        midi_ports = midi_device_manager.list_output_ports()
-        cli_interface.display_midi_ports(midi_ports)
+            # Display MIDI ports
+            midi_ports = midi_device_manager.list_output_ports()
+            cli_interface.display_midi_ports(midi_ports)
 
-    except Exception as e:
-        cli_interface.display_error_panel(e)
-        logger.exception("Error in list-devices command")
-        sys.exit(1)
-    finally:
-        # Clean up
-        try:
-            if "audio_device_manager" in locals():
-                audio_device_manager.close()
-            if "midi_device_manager" in locals():
-                midi_device_manager.close()
-        except Exception:
-            pass
+        except Exception as e:
+            cli_interface.display_error_panel(e)
+            logger.exception("Error in list-devices command")
+            sys.exit(1)
 
 
 @cli.command("show")
@@ -473,6 +538,9 @@ def show_config(config_path: str) -> None:
     This command shows your current saved configuration including device
     selections, audio settings, MIDI settings, and pitch detection parameters.
     """
+    from ..config import ConfigManager
+    from .interface import CLIInterface
+
     cli_interface = CLIInterface()
 
     try:
@@ -500,6 +568,9 @@ def reset_config(config_path: str) -> None:
     This command deletes your saved configuration file, forcing the application
     to use default settings and prompting for device selection on next run.
     """
+    from ..config import ConfigManager
+    from .interface import CLIInterface
+
     cli_interface = CLIInterface()
 
     try:
@@ -534,9 +605,7 @@ def help_command() -> None:
     This command provides comprehensive help information about using the
     Audio to MIDI application, including examples and troubleshooting tips.
     """
+    from .interface import CLIInterface
+
     cli_interface = CLIInterface()
     cli_interface.display_help_panel()
-
-
-if __name__ == "__main__":
-    cli()
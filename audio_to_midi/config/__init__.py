@@ -18,7 +18,7 @@ Example:
     'Built-in Microphone'
 """
 
-from .manager import ConfigManager
+from .manager import ConfigManager, invalidate_settings_cache, load_settings
 from .settings import Settings
 
-__all__ = ["ConfigManager", "Settings"]
+__all__ = ["ConfigManager", "Settings", "load_settings", "invalidate_settings_cache"]
@@ -5,13 +5,18 @@ This module provides a centralized way to handle all configuration operations
 including file I/O, validation, and default value management.
 """
 
+import copy
+import functools
 import json
 import logging
+import os
+import stat
+import tempfile
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from ..core.exceptions import ConfigError
-from .settings import DEFAULT_CONFIG_PATH, Settings
+from .settings import Settings, default_config_path, loads_json
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +43,7 @@ class ConfigManager:
         Args:
             config_path: Path to configuration file. If None, uses default path.
         """
-        self.config_path = Path(config_path or DEFAULT_CONFIG_PATH)
+        self.config_path = Path(config_path or default_config_path())
         self._settings = Settings()
         self._loaded = False
 
@@ -59,16 +64,7 @@ class ConfigManager:
             return self._settings
 
         try:
-            with open(self.config_path) as f:
-                data = json.load(f)
-
-            # Handle legacy format compatibility
-            if self._is_legacy_format(data):
-                logger.info("Converting legacy configuration format")
-                data = self._convert_legacy_format(data)
-
-            self._settings = Settings.from_dict(data)
-            self._settings.validate()
+            self._settings = load_settings(str(self.config_path))
             self._loaded = True
 
             logger.info(f"Configuration loaded from {self.config_path}")
@@ -83,6 +79,10 @@ class ConfigManager:
         """
         Save current configuration to file.
 
+        The file is left untouched when its contents already match the current
+        settings. Otherwise it is replaced atomically, so concurrent readers
+        never see partially written JSON.
+
         Raises:
             ConfigError: If configuration cannot be saved.
         """
@@ -96,14 +96,55 @@ class ConfigManager:
             # Validate before saving
             self._settings.validate()
 
-            with open(self.config_path, "w") as f:
-                json.dump(self._settings.to_dict(), f, indent=2)
+            data = self._settings.to_json_bytes()
+            if self._file_matches(data):
+                logger.debug(f"Configuration unchanged, not saving {self.config_path}")
+                return
+
+            self._write_atomic(data)
 
             logger.info(f"Configuration saved to {self.config_path}")
 
         except Exception as e:
             raise ConfigError(f"Failed to save configuration: {e}")
 
+    def _file_matches(self, data: bytes) -> bool:
+        """Check whether the config file already contains exactly data."""
+        try:
+            if self.config_path.stat().st_size != len(data):
+                return False
+            return self.config_path.read_bytes() == data
+        except OSError:
+            return False
+
+    def _write_atomic(self, data: bytes) -> None:
+        """Write data to a temporary file and move it over the config file."""
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.config_path.parent, prefix=f".{self.config_path.name}."
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            # mkstemp creates the file as 0600; keep the config file's mode
+            os.chmod(tmp_path, self._file_mode())
+            os.replace(tmp_path, self.config_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _file_mode(self) -> int:
+        """Return the config file's permission bits, or the umask default."""
+        try:
+            return stat.S_IMODE(self.config_path.stat().st_mode)
+        except OSError:
+            # os.umask can only be read by setting it
+            umask = os.umask(0)
+            os.umask(umask)
+            return 0o666 & ~umask
+
     def get_settings(self) -> Settings:
         """
         Get current settings.
@@ -153,7 +194,8 @@ class ConfigManager:
         except Exception as e:
             raise ConfigError(f"Failed to delete configuration file: {e}")
 
-    def _is_legacy_format(self, data: Dict[str, Any]) -> bool:
+    @staticmethod
+    def _is_legacy_format(data: Dict[str, Any]) -> bool:
         """Check if configuration is in legacy format."""
         legacy_keys = {
             "audio_index",
@@ -169,7 +211,8 @@ class ConfigManager:
         }
         return any(key in data for key in legacy_keys)
 
-    def _convert_legacy_format(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _convert_legacy_format(data: Dict[str, Any]) -> Dict[str, Any]:
         """Convert legacy configuration format to new format."""
         new_format = {
             "audio": {
@@ -219,3 +262,44 @@ class ConfigManager:
     def config_exists(self) -> bool:
         """Check if configuration file exists."""
         return self.config_path.exists()
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config_file(path: str, mtime_ns: int, size: int) -> Settings:
+    """Parse and validate a config file, cached on its path, mtime and size."""
+    data = loads_json(Path(path).read_bytes())
+
+    # Handle legacy format compatibility
+    if ConfigManager._is_legacy_format(data):
+        logger.info("Converting legacy configuration format")
+        data = ConfigManager._convert_legacy_format(data)
+
+    settings = Settings.from_dict(data)
+    settings.validate()
+    return settings
+
+
+def load_settings(path: Optional[str] = None) -> Settings:
+    """
+    Load settings from a configuration file.
+
+    The parsed file is cached until its modification time or size changes, so
+    repeated loads of an unchanged file only cost a stat call.
+
+    Args:
+        path: Path to configuration file. If None, uses default path.
+
+    Returns:
+        A private copy of the loaded settings that callers may modify.
+    """
+    config_path = Path(path or default_config_path())
+    file_stat = config_path.stat()
+    settings = _parse_config_file(
+        str(config_path), file_stat.st_mtime_ns, file_stat.st_size
+    )
+    return copy.deepcopy(settings)
+
+
+def invalidate_settings_cache() -> None:
+    """Drop all cached configuration file parses."""
+    _parse_config_file.cache_clear()
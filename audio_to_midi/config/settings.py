@@ -5,12 +5,45 @@ This module defines the structure and validation rules for all configuration
 settings, providing type safety and default values.
 """
 
+import functools
+import json
 import os
-from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+import sys
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
-@dataclass
+try:
+    import msgspec
+except ImportError:
+    msgspec = None  # type: ignore[assignment]
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None  # type: ignore[assignment]
+
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__
+_DATACLASS_OPTIONS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+# (predicate, error message) pairs checked in order by each validate()
+_Rules = Tuple[Tuple[Callable[[Any], bool], str], ...]
+
+
+def _check_rules(settings: Any, rules: _Rules) -> None:
+    """Raise ValueError with the message of the first rule that fails."""
+    for predicate, message in rules:
+        if not predicate(settings):
+            raise ValueError(message)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class AudioSettings:
     """Audio-related configuration settings."""
 
@@ -20,20 +53,24 @@ class AudioSettings:
     input_device_index: Optional[int] = None
     input_device_name: Optional[str] = None
     silence_threshold: float = 0.01
+    # Samples per pitch analysis; larger than chunk_size overlaps analyses
+    # (0 derives it from the lowest pitch to detect)
+    analysis_size: int = 0
+
+    _RULES: ClassVar[_Rules] = (
+        (lambda s: s.sample_rate > 0, "Sample rate must be positive"),
+        (lambda s: s.chunk_size > 0, "Chunk size must be positive"),
+        (lambda s: s.channels > 0, "Channels must be positive"),
+        (lambda s: s.silence_threshold >= 0, "Silence threshold must be non-negative"),
+        (lambda s: s.analysis_size >= 0, "Analysis size must be non-negative"),
+    )
 
     def validate(self) -> None:
         """Validate audio settings."""
-        if self.sample_rate <= 0:
-            raise ValueError("Sample rate must be positive")
-        if self.chunk_size <= 0:
-            raise ValueError("Chunk size must be positive")
-        if self.channels <= 0:
-            raise ValueError("Channels must be positive")
-        if self.silence_threshold < 0:
-            raise ValueError("Silence threshold must be non-negative")
+        _check_rules(self, self._RULES)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MidiSettings:
     """MIDI-related configuration settings."""
 
@@ -44,19 +81,25 @@ class MidiSettings:
     transpose_semitones: int = 0
     max_midi_note: int = 84
 
+    _RULES: ClassVar[_Rules] = (
+        (lambda s: 0 <= s.channel <= 15, "MIDI channel must be between 0 and 15"),
+        (lambda s: 1 <= s.velocity <= 127, "MIDI velocity must be between 1 and 127"),
+        (
+            lambda s: -24 <= s.transpose_semitones <= 24,
+            "Transpose must be between -24 and 24 semitones",
+        ),
+        (
+            lambda s: 0 <= s.max_midi_note <= 127,
+            "Max MIDI note must be between 0 and 127",
+        ),
+    )
+
     def validate(self) -> None:
         """Validate MIDI settings."""
-        if not (0 <= self.channel <= 15):
-            raise ValueError("MIDI channel must be between 0 and 15")
-        if not (1 <= self.velocity <= 127):
-            raise ValueError("MIDI velocity must be between 1 and 127")
-        if not (-24 <= self.transpose_semitones <= 24):
-            raise ValueError("Transpose must be between -24 and 24 semitones")
-        if not (0 <= self.max_midi_note <= 127):
-            raise ValueError("Max MIDI note must be between 0 and 127")
+        _check_rules(self, self._RULES)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PitchSettings:
     """Pitch detection configuration settings."""
 
@@ -68,40 +111,137 @@ class PitchSettings:
     min_note_duration: float = 0.20
     silence_release_time: float = 0.1
 
+    _RULES: ClassVar[_Rules] = (
+        (lambda s: s.min_freq > 0, "Minimum frequency must be positive"),
+        (
+            lambda s: s.max_freq > s.min_freq,
+            "Maximum frequency must be greater than minimum",
+        ),
+        (
+            lambda s: 0 <= s.confidence_threshold <= 1,
+            "Confidence threshold must be between 0 and 1",
+        ),
+        (
+            lambda s: s.min_semitone_diff >= 0,
+            "Minimum semitone difference must be non-negative",
+        ),
+        (lambda s: s.debounce_time >= 0, "Debounce time must be non-negative"),
+        (
+            lambda s: s.min_note_duration >= 0,
+            "Minimum note duration must be non-negative",
+        ),
+        (
+            lambda s: s.silence_release_time >= 0,
+            "Silence release time must be non-negative",
+        ),
+    )
+
     def validate(self) -> None:
         """Validate pitch detection settings."""
-        if self.min_freq <= 0:
-            raise ValueError("Minimum frequency must be positive")
-        if self.max_freq <= self.min_freq:
-            raise ValueError("Maximum frequency must be greater than minimum")
-        if not (0 <= self.confidence_threshold <= 1):
-            raise ValueError("Confidence threshold must be between 0 and 1")
-        if self.min_semitone_diff < 0:
-            raise ValueError("Minimum semitone difference must be non-negative")
-        if self.debounce_time < 0:
-            raise ValueError("Debounce time must be non-negative")
-        if self.min_note_duration < 0:
-            raise ValueError("Minimum note duration must be non-negative")
-        if self.silence_release_time < 0:
-            raise ValueError("Silence release time must be non-negative")
-
-
-@dataclass
+        _check_rules(self, self._RULES)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class PedalSettings:
     """Pedal configuration settings."""
 
     port: Optional[str] = None
     message: Optional[Dict[str, Any]] = None
 
+    _REQUIRED_MESSAGE_KEYS: ClassVar[FrozenSet[str]] = frozenset({"type"})
+
     def validate(self) -> None:
         """Validate pedal settings."""
-        if self.message is not None:
-            required_keys = {"type"}
-            if not all(key in self.message for key in required_keys):
-                raise ValueError("Pedal message must contain 'type' key")
+        if (
+            self.message is not None
+            and not self._REQUIRED_MESSAGE_KEYS <= self.message.keys()
+        ):
+            raise ValueError("Pedal message must contain 'type' key")
+
+
+# (section name, settings class) pairs, in Settings field order
+_SECTION_TYPES: Tuple[Tuple[str, Any], ...] = (
+    ("audio", AudioSettings),
+    ("midi", MidiSettings),
+    ("pitch", PitchSettings),
+    ("pedal", PedalSettings),
+)
+
+# Field names of each settings section, in declaration order
+_SECTION_FIELDS: Dict[str, Tuple[str, ...]] = {
+    section: tuple(f.name for f in fields(section_type))
+    for section, section_type in _SECTION_TYPES
+}
+
+
+# JSON schema for the serialized settings; mirrors the per-field validate() rules,
+# which check ranges but not int vs float, so numeric fields are "number"
+_OPTIONAL_NUMBER = {"type": ["number", "null"]}
+_OPTIONAL_STR = {"type": ["string", "null"]}
+_NON_NEGATIVE = {"type": "number", "minimum": 0}
+_SETTINGS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "audio": {
+            "type": "object",
+            "properties": {
+                "sample_rate": {"type": "number", "exclusiveMinimum": 0},
+                "chunk_size": {"type": "number", "exclusiveMinimum": 0},
+                "channels": {"type": "number", "exclusiveMinimum": 0},
+                "input_device_index": _OPTIONAL_NUMBER,
+                "input_device_name": _OPTIONAL_STR,
+                "silence_threshold": _NON_NEGATIVE,
+                "analysis_size": {"type": "number", "minimum": 0},
+            },
+        },
+        "midi": {
+            "type": "object",
+            "properties": {
+                "output_port_index": _OPTIONAL_NUMBER,
+                "output_port_name": _OPTIONAL_STR,
+                "channel": {"type": "number", "minimum": 0, "maximum": 15},
+                "velocity": {"type": "number", "minimum": 1, "maximum": 127},
+                "transpose_semitones": {
+                    "type": "number",
+                    "minimum": -24,
+                    "maximum": 24,
+                },
+                "max_midi_note": {"type": "number", "minimum": 0, "maximum": 127},
+            },
+        },
+        "pitch": {
+            "type": "object",
+            "properties": {
+                "min_freq": {"type": "number", "exclusiveMinimum": 0},
+                "max_freq": {"type": "number", "exclusiveMinimum": 0},
+                "confidence_threshold": {
+                    "type": "number",
+                    "minimum": 0,
+                    "maximum": 1,
+                },
+                "min_semitone_diff": {"type": "number", "minimum": 0},
+                "debounce_time": _NON_NEGATIVE,
+                "min_note_duration": _NON_NEGATIVE,
+                "silence_release_time": _NON_NEGATIVE,
+            },
+        },
+        "pedal": {
+            "type": "object",
+            "properties": {
+                "port": _OPTIONAL_STR,
+                "message": {"type": ["object", "null"], "required": ["type"]},
+            },
+        },
+    },
+}
 
+# Compiled once at import; raises fastjsonschema.JsonSchemaValueException (a ValueError)
+_validate_schema: Optional[Callable[[Any], Any]] = (
+    fastjsonschema.compile(_SETTINGS_SCHEMA) if fastjsonschema is not None else None
+)
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Settings:
     """Complete application settings."""
 
@@ -120,85 +260,104 @@ class Settings:
     def to_dict(self) -> Dict[str, Any]:
         """Convert settings to dictionary for JSON serialization."""
         return {
-            "audio": {
-                "sample_rate": self.audio.sample_rate,
-                "chunk_size": self.audio.chunk_size,
-                "channels": self.audio.channels,
-                "input_device_index": self.audio.input_device_index,
-                "input_device_name": self.audio.input_device_name,
-                "silence_threshold": self.audio.silence_threshold,
-            },
-            "midi": {
-                "output_port_index": self.midi.output_port_index,
-                "output_port_name": self.midi.output_port_name,
-                "channel": self.midi.channel,
-                "velocity": self.midi.velocity,
-                "transpose_semitones": self.midi.transpose_semitones,
-                "max_midi_note": self.midi.max_midi_note,
-            },
-            "pitch": {
-                "min_freq": self.pitch.min_freq,
-                "max_freq": self.pitch.max_freq,
-                "confidence_threshold": self.pitch.confidence_threshold,
-                "min_semitone_diff": self.pitch.min_semitone_diff,
-                "debounce_time": self.pitch.debounce_time,
-                "min_note_duration": self.pitch.min_note_duration,
-                "silence_release_time": self.pitch.silence_release_time,
-            },
-            "pedal": {
-                "port": self.pedal.port,
-                "message": self.pedal.message,
-            },
+            section: {
+                name: getattr(section_settings, name)
+                for name in _SECTION_FIELDS[section]
+            }
+            for section, section_settings in (
+                ("audio", self.audio),
+                ("midi", self.midi),
+                ("pitch", self.pitch),
+                ("pedal", self.pedal),
+            )
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize settings to indented JSON bytes."""
+        if orjson is not None:
+            # orjson serializes dataclasses natively, skipping to_dict
+            return orjson.dumps(self, option=orjson.OPT_INDENT_2)
+        return json.dumps(self.to_dict(), indent=2).encode()
+
+    def to_msgpack(self) -> bytes:
+        """Serialize settings to MessagePack for in-process or IPC transfer."""
+        if msgspec is None:
+            raise ImportError("MessagePack support requires msgspec")
+        return msgspec.msgpack.encode(self)
+
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> "Settings":
+        """
+        Create and validate settings from MessagePack bytes.
+
+        Args:
+            data: Bytes produced by to_msgpack
+
+        Returns:
+            Validated settings
+
+        Raises:
+            ValueError: If the data is malformed or fails validation
+        """
+        if msgspec is None:
+            raise ImportError("MessagePack support requires msgspec")
+        try:
+            settings = msgspec.msgpack.decode(data, type=cls)
+        except msgspec.ValidationError:
+            # Types msgspec rejects but from_dict accepts (e.g. 44100.0 for
+            # an int field) go through the same fallback as JSON input
+            settings = cls.from_dict(msgspec.msgpack.decode(data))
+        settings.validate()
+        return settings
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Settings":
         """Create settings from dictionary (JSON deserialization)."""
-        settings = cls()
-
-        if "audio" in data:
-            audio_data = data["audio"]
-            settings.audio = AudioSettings(
-                sample_rate=audio_data.get("sample_rate", 44100),
-                chunk_size=audio_data.get("chunk_size", 1024),
-                channels=audio_data.get("channels", 1),
-                input_device_index=audio_data.get("input_device_index"),
-                input_device_name=audio_data.get("input_device_name"),
-                silence_threshold=audio_data.get("silence_threshold", 0.01),
-            )
+        if _validate_schema is not None:
+            # Reject malformed input before building any dataclasses
+            _validate_schema(data)
 
-        if "midi" in data:
-            midi_data = data["midi"]
-            settings.midi = MidiSettings(
-                output_port_index=midi_data.get("output_port_index"),
-                output_port_name=midi_data.get("output_port_name"),
-                channel=midi_data.get("channel", 0),
-                velocity=midi_data.get("velocity", 64),
-                transpose_semitones=midi_data.get("transpose_semitones", 0),
-                max_midi_note=midi_data.get("max_midi_note", 84),
-            )
+        if msgspec is not None:
+            # msgspec builds the nested dataclasses in C. It is stricter about
+            # types than validate() (e.g. 44100.0 for an int field), so such
+            # input is built by the loop below instead of being rejected
+            try:
+                return msgspec.convert(data, type=cls)
+            except msgspec.ValidationError:
+                pass
 
-        if "pitch" in data:
-            pitch_data = data["pitch"]
-            settings.pitch = PitchSettings(
-                min_freq=pitch_data.get("min_freq", 80.0),
-                max_freq=pitch_data.get("max_freq", 800.0),
-                confidence_threshold=pitch_data.get("confidence_threshold", 0.8),
-                min_semitone_diff=pitch_data.get("min_semitone_diff", 1),
-                debounce_time=pitch_data.get("debounce_time", 0.08),
-                min_note_duration=pitch_data.get("min_note_duration", 0.20),
-                silence_release_time=pitch_data.get("silence_release_time", 0.1),
-            )
+        # Only sections present in data are built; missing fields keep their
+        # dataclass defaults and unknown keys are ignored
+        sections: Dict[str, Any] = {}
+        for section, section_type in _SECTION_TYPES:
+            if section in data:
+                section_data = data[section]
+                sections[section] = section_type(
+                    **{
+                        name: section_data[name]
+                        for name in _SECTION_FIELDS[section]
+                        if name in section_data
+                    }
+                )
 
-        if "pedal" in data:
-            pedal_data = data["pedal"]
-            settings.pedal = PedalSettings(
-                port=pedal_data.get("port"),
-                message=pedal_data.get("message"),
-            )
+        return cls(**sections)
 
-        return settings
+
+@functools.lru_cache(maxsize=None)
+def default_config_path() -> str:
+    """Return the default configuration file path, resolved on first use."""
+    return os.path.expanduser("~/.audio_to_midi_config.json")
+
+
+def loads_json(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
-# Default configuration file path
-DEFAULT_CONFIG_PATH = os.path.expanduser("~/.audio_to_midi_config.json")
+def __getattr__(name: str) -> Any:
+    # DEFAULT_CONFIG_PATH is kept for compatibility but resolved lazily
+    if name == "DEFAULT_CONFIG_PATH":
+        return default_config_path()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -17,9 +17,13 @@ Example:
     >>> app.start()
 """
 
-from .application import AudioToMidiApp
+from typing import TYPE_CHECKING, Any, List
+
 from .exceptions import AudioError, ConfigError, MidiError, AudioToMidiError
 
+if TYPE_CHECKING:
+    from .application import AudioToMidiApp
+
 __all__ = [
     "AudioToMidiApp",
     "AudioToMidiError",
@@ -27,3 +31,16 @@ __all__ = [
     "MidiError",
     "ConfigError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Import the application (and its audio/MIDI stack) on first access only
+    if name == "AudioToMidiApp":
+        from .application import AudioToMidiApp
+
+        return AudioToMidiApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
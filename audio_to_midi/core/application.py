@@ -6,17 +6,34 @@ modules and manages the main processing pipeline.
 """
 
 import logging
-import queue
 import threading
 import time
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional, Tuple
 
 from ..config import ConfigManager, Settings
 from ..core.exceptions import AudioError, MidiError, AudioToMidiError
-from ..utils.helpers import setup_logging
+from ..core.note_fsm import NoteStateMachine
+from ..core.ringbuffer import SPSCRing
+from ..utils.helpers import (
+    pitch_analysis_size,
+    pitch_decimation_factor,
+    setup_logging,
+)
 
 logger = logging.getLogger(__name__)
 
+# Slots per pipeline ring
+PIPELINE_RING_SIZE = 32
+
+# Seconds run() waits between checks for a keyboard interrupt
+RUN_WAIT_TIMEOUT = 1.0
+
+# (note, frequency, confidence) handed to the MIDI thread; note is None for
+# note off. Tuples are cheaper to build than dicts on the processing thread
+MidiEvent = Tuple[Optional[int], float, float]
+
+_NOTE_OFF_EVENT: MidiEvent = (None, 0.0, 0.0)
+
 
 class AudioToMidiApp:
     """
@@ -59,10 +76,13 @@ class AudioToMidiApp:
         # Runtime state
         self.is_running = False
         self.threads: list = []
-        self.queues: dict = {
-            "audio": queue.Queue(),
-            "pitch": queue.Queue(),
-            "midi": queue.Queue(),
+        # Set by stop(); run() parks on it instead of polling is_running
+        self._stop_event = threading.Event()
+        # One producer and one consumer per stage, so no locking is needed
+        # (captured audio is buffered by AudioCapture itself, and status is
+        # reported through on_note_change from the processing thread)
+        self.queues: Dict[str, SPSCRing] = {
+            "midi": SPSCRing(PIPELINE_RING_SIZE),
         }
 
         # Event handlers
@@ -76,12 +96,8 @@ class AudioToMidiApp:
         self.current_confidence = 0.0
         self.last_midi_note = None
 
-        # Robust note detection state
-        self.last_pitch = None
-        self.last_pitch_time = 0
-        self.stable_pitch = None
-        self.stable_pitch_time = 0
-        self.silence_start_time = None
+        # Debounced note on/off tracking, built from the pitch settings
+        self.note_fsm: Optional[NoteStateMachine] = None
 
         # Setup logging
         setup_logging()
@@ -218,7 +234,12 @@ class AudioToMidiApp:
             # Initialize modules with current settings
             self._initialize_modules()
 
+            # Fresh rings, since stop() closes the previous ones
+            for name in self.queues:
+                self.queues[name] = SPSCRing(PIPELINE_RING_SIZE)
+
             # Start processing threads
+            self._stop_event.clear()
             self.is_running = True
             self._start_threads()
 
@@ -236,6 +257,10 @@ class AudioToMidiApp:
 
         logger.info("Stopping audio to MIDI application")
         self.is_running = False
+        self._stop_event.set()
+        # Wake the worker threads, which block on their rings without a timeout
+        for ring in self.queues.values():
+            ring.close()
 
         # Stop all threads
         for thread in self.threads:
@@ -259,8 +284,10 @@ class AudioToMidiApp:
         try:
             self.start()
 
-            while self.is_running:
-                time.sleep(0.1)
+            # Wake only on stop(); the timeout just keeps Ctrl+C responsive on
+            # Windows, where an untimed wait cannot be interrupted
+            while not self._stop_event.wait(RUN_WAIT_TIMEOUT):
+                pass
 
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt")
@@ -293,18 +320,28 @@ class AudioToMidiApp:
             channels=settings.audio.channels,
             device_index=settings.audio.input_device_index,
         )
-        # Initialize audio processor
-        self.audio_processor.configure(
-            sample_rate=settings.audio.sample_rate,
-            silence_threshold=settings.audio.silence_threshold,
+        # Pitch analysis runs on a downsampled signal since nothing far above
+        # max_freq is needed
+        decimation = pitch_decimation_factor(
+            settings.audio.sample_rate, settings.pitch.max_freq
         )
         # Initialize pitch detector
         self.pitch_detector.configure(
-            sample_rate=settings.audio.sample_rate,
+            sample_rate=settings.audio.sample_rate / decimation,
             min_freq=settings.pitch.min_freq,
             max_freq=settings.pitch.max_freq,
             confidence_threshold=settings.pitch.confidence_threshold,
         )
+        # Initialize audio processor; YIN compares the signal with shifted
+        # copies of itself, which a tapering window distorts at long lags
+        self.audio_processor.configure(
+            sample_rate=settings.audio.sample_rate,
+            silence_threshold=settings.audio.silence_threshold,
+            window_type="none" if self.pitch_detector.algorithm == "yin" else "hann",
+            decimation=decimation,
+            analysis_size=self._analysis_size(settings, decimation),
+        )
+        self.note_fsm = NoteStateMachine(settings.pitch)
         # Configure smoothing for more stable pitch detection
         self.pitch_detector.set_smoothing(enabled=False)
         # Initialize MIDI output
@@ -319,16 +356,41 @@ class AudioToMidiApp:
                 f"Failed to connect to MIDI port: {settings.midi.output_port_name}"
             )
 
-    def _start_threads(self) -> None:
-        """Start all processing threads."""
-        # Audio capture thread
-        audio_thread = threading.Thread(
-            target=self._audio_capture_loop, name="AudioCapture", daemon=True
+    def _analysis_size(self, settings: Settings, decimation: int) -> int:
+        """
+        Input samples per pitch analysis for the current settings.
+
+        A single chunk can be too short for the lowest configured pitch (two
+        periods of 80 Hz are 1103 samples at 44.1 kHz), so the analysis
+        window is widened to cover min_freq.
+
+        Args:
+            settings: Settings being applied
+            decimation: Decimation factor applied before pitch detection
+
+        Returns:
+            Analysis size for AudioProcessor.configure (0 analyzes each chunk
+            on its own)
+        """
+        required = pitch_analysis_size(
+            settings.audio.sample_rate, settings.pitch.min_freq, decimation
         )
-        audio_thread.start()
-        self.threads.append(audio_thread)
+        analysis_size = settings.audio.analysis_size
+        if analysis_size == 0:
+            # Derived from min_freq; chunks long enough need no rolling window
+            return required if required > settings.audio.chunk_size else 0
+        if analysis_size < required:
+            logger.warning(
+                f"Analysis size {analysis_size} is too short for "
+                f"{settings.pitch.min_freq} Hz, using {required} samples"
+            )
+            return required
+        return analysis_size
 
-        # Audio processing thread
+    def _start_threads(self) -> None:
+        """Start all processing threads."""
+        # Audio processing thread; reads straight from the capture callback's
+        # buffer, so no separate capture thread relays chunks
         processing_thread = threading.Thread(
             target=self._audio_processing_loop, name="AudioProcessing", daemon=True
         )
@@ -342,147 +404,104 @@ class AudioToMidiApp:
         midi_thread.start()
         self.threads.append(midi_thread)
 
-    def _audio_capture_loop(self) -> None:
-        """Audio capture processing loop."""
-        logger.info("Audio capture loop started")
+    def _audio_processing_loop(self) -> None:
+        """Audio capture, processing and pitch detection loop."""
+        logger.info("Audio processing loop started")
         try:
             if self.audio_capture is None:
                 logger.error("Audio capture module not injected")
                 return
-            self.audio_capture.start()
-            logger.info("Audio capture started successfully")
-
-            while self.is_running:
-                try:
-                    audio_data = self.audio_capture.get_audio_data(timeout=0.1)
-                    if audio_data is not None:
-                        self.queues["audio"].put(audio_data)
-                except queue.Empty:
-                    continue
-                except Exception as e:
-                    logger.error(f"Audio capture error: {e}")
-                    if self.on_error:
-                        self.on_error(AudioError(f"Audio capture error: {e}"))
-                    break
-
-        except Exception as e:
-            logger.error(f"Audio capture loop error: {e}")
-            if self.on_error:
-                self.on_error(AudioError(f"Audio capture loop error: {e}"))
-        finally:
-            if self.audio_capture is not None:
-                self.audio_capture.stop()
-
-    def _audio_processing_loop(self) -> None:
-        """Audio processing and pitch detection loop."""
-        logger.info("Audio processing loop started")
-        try:
             if self.audio_processor is None or self.pitch_detector is None:
                 logger.error("Audio processor or pitch detector module not injected")
                 return
+            if self.settings is None or self.note_fsm is None:
+                logger.error("Settings or note state machine not initialized")
+                return
+
+            # Bind per-chunk lookups once; settings are fixed while running
+            from ..utils.helpers import frequency_to_midi_note
+
+            note_fsm = self.note_fsm
+            confidence_threshold = self.settings.pitch.confidence_threshold
+            transpose = self.settings.midi.transpose_semitones
+            get_audio_data = self.audio_capture.get_audio_data
+            is_silent = self.audio_processor.is_silent
+            clear_history = self.audio_processor.clear_history
+            process = self.audio_processor.process
+            detect_pitch = self.pitch_detector.detect_pitch
+            debug = logger.isEnabledFor(logging.DEBUG)
+
+            try:
+                self.audio_capture.start()
+            except Exception as e:
+                logger.error(f"Audio capture error: {e}")
+                if self.on_error:
+                    self.on_error(AudioError(f"Audio capture error: {e}"))
+                return
+            logger.info("Audio capture started successfully")
+
             while self.is_running:
                 try:
-                    audio_data = self.queues["audio"].get(timeout=0.1)
+                    # A view of the capture slot, valid until the next call;
+                    # process() does not keep it and its result is used up
+                    # before the next read
+                    audio_data = get_audio_data(timeout=0.1, copy=False)
+                    if audio_data is None:
+                        continue
 
-                    # Process audio data
-                    processed_data = self.audio_processor.process(audio_data)
+                    # Silent chunks (e.g. between notes) skip filtering and
+                    # pitch detection, but still advance the note release timer
+                    if is_silent(audio_data):
+                        # process() is skipped, so reset the filter state and
+                        # analysis window rather than resume from before the
+                        # silence
+                        clear_history()
+                        frequency, confidence = None, 0.0
+                    else:
+                        # Process audio data
+                        processed_data = process(audio_data)
 
-                    # Detect pitch
-                    frequency, confidence = self.pitch_detector.detect_pitch(
-                        processed_data
-                    )
+                        # Detect pitch
+                        frequency, confidence = detect_pitch(processed_data)
 
                     # Update current state
                     self.current_frequency = frequency or 0.0
                     self.current_confidence = confidence
-                    current_time = time.time()
+                    now_ns = time.monotonic_ns()
 
                     # Note detection algorithm with silence detection
-                    if frequency is None or (
-                        self.settings is not None
-                        and confidence < self.settings.pitch.confidence_threshold
-                    ):
-                        if self.current_note is not None:
-                            if self.silence_start_time is None:
-                                self.silence_start_time = current_time
-                            elif (
-                                self.settings is not None
-                                and current_time - self.silence_start_time
-                                >= self.settings.pitch.silence_release_time
-                            ):
-                                # Send note off
-                                self.queues["midi"].put(
-                                    {"note": None, "frequency": 0.0, "confidence": 0.0}
-                                )
-                                self.current_note = None
-                                if self.on_note_change:
-                                    self.on_note_change(None, 0.0, 0.0)
+                    if frequency is None or confidence < confidence_threshold:
+                        emit, _ = note_fsm.on_silence(now_ns)
+                        if emit:
+                            # Send note off
+                            self._push_midi(_NOTE_OFF_EVENT)
+                            self.current_note = None
+                            if self.on_note_change:
+                                self.on_note_change(None, 0.0, 0.0)
                         continue
-                    else:
-                        self.silence_start_time = None
 
-                    midi_note = self._frequency_to_midi_note(frequency)
-                    logger.debug(
-                        f"Frequency {frequency:.1f} Hz -> MIDI note {midi_note}"
-                    )
-
-                    # Debounce: Only trigger if pitch is stable for debounce_time and differs by min_semitone_diff
-                    if self.last_pitch is None or (
-                        self.settings is not None
-                        and abs(midi_note - self.last_pitch)
-                        >= self.settings.pitch.min_semitone_diff
-                    ):
-                        self.stable_pitch = midi_note
-                        self.stable_pitch_time = current_time
+                    midi_note = frequency_to_midi_note(frequency, transpose)
+                    if debug:
                         logger.debug(
-                            f"Reset stable pitch to {midi_note}, last_pitch was {self.last_pitch}"
+                            "Frequency %.1f Hz -> MIDI note %s", frequency, midi_note
                         )
-                    elif midi_note == self.stable_pitch and (
-                        current_time - self.stable_pitch_time
-                    ) >= (
-                        self.settings.pitch.debounce_time
-                        if self.settings is not None
-                        else 0
-                    ):
-                        # Only send note if it's different from the current note and held for min_note_duration
-                        if (
-                            self.current_note is None or midi_note != self.current_note
-                        ) and (current_time - self.stable_pitch_time) >= (
-                            self.settings.pitch.min_note_duration
-                            if self.settings is not None
-                            else 0
-                        ):
-                            # Send new note
-                            self.current_note = midi_note
-                            logger.debug(f"Sending MIDI note: {midi_note}")
-                            self.queues["midi"].put(
-                                {
-                                    "note": midi_note,
-                                    "frequency": frequency,
-                                    "confidence": confidence,
-                                }
-                            )
 
-                            if self.on_note_change:
-                                self.on_note_change(midi_note, frequency, confidence)
-                        else:
-                            logger.debug(
-                                f"Not sending note {midi_note}: current_note={self.current_note}, time_held={current_time - self.stable_pitch_time:.3f}"
-                            )
-                    else:
-                        logger.debug(
-                            f"Note {midi_note} not stable yet: stable_pitch={self.stable_pitch}, time_since_stable={current_time - self.stable_pitch_time:.3f}"
-                        )
+                    # Debounce: only emits once the pitch is stable and held long enough
+                    emit, note = note_fsm.on_pitch(midi_note, now_ns)
+                    if emit:
+                        # Send new note
+                        self.current_note = note
+                        if debug:
+                            logger.debug("Sending MIDI note: %s", note)
+                        self._push_midi((note, frequency, confidence))
 
-                    self.last_pitch = midi_note
-                    self.last_pitch_time = current_time
+                        if self.on_note_change:
+                            self.on_note_change(note, frequency, confidence)
 
                     # Call frequency change handler
                     if self.on_frequency_change:
                         self.on_frequency_change(self.current_frequency, confidence)
 
-                except queue.Empty:
-                    continue
                 except Exception as e:
                     logger.error(f"Audio processing error: {e}")
                     if self.on_error:
@@ -493,38 +512,51 @@ class AudioToMidiApp:
             logger.error(f"Audio processing loop error: {e}")
             if self.on_error:
                 self.on_error(VoiceToMidiError(f"Audio processing loop error: {e}"))
+        finally:
+            if self.audio_capture is not None:
+                self.audio_capture.stop()
 
     def _midi_output_loop(self) -> None:
         """MIDI output processing loop."""
         try:
+            if self.midi_output is None:
+                logger.error("MIDI output module not injected")
+                return
+
+            midi_ring = self.queues["midi"]
+            send_note_on = self.midi_output.send_note_on
+            send_note_off = self.midi_output.send_note_off
+
             while self.is_running:
                 try:
-                    midi_data = self.queues["midi"].get(timeout=0.1)
+                    # Sleeps until an event arrives or stop() closes the ring,
+                    # so an idle output thread does not wake up at all
+                    event = midi_ring.pop()
+                    if event is None:
+                        continue
 
-                    note = midi_data["note"]
+                    note = event[0]
 
                     if note is not None:
                         # Send note off for previous note first
                         if self.last_midi_note is not None:
-                            self.midi_output.send_note_off(self.last_midi_note)
-                            logger.debug(f"MIDI note off sent: {self.last_midi_note}")
+                            send_note_off(self.last_midi_note)
+                            logger.debug("MIDI note off sent: %s", self.last_midi_note)
 
                         # Send note on for new note
-                        success = self.midi_output.send_note_on(note)
+                        success = send_note_on(note)
                         if success:
-                            logger.debug(f"MIDI note on sent: {note}")
+                            logger.debug("MIDI note on sent: %s", note)
                             self.last_midi_note = note
                         else:
                             logger.warning(f"Failed to send MIDI note on: {note}")
                     else:
                         # Send note off for current note
                         if self.last_midi_note is not None:
-                            self.midi_output.send_note_off(self.last_midi_note)
-                            logger.debug(f"MIDI note off sent: {self.last_midi_note}")
+                            send_note_off(self.last_midi_note)
+                            logger.debug("MIDI note off sent: %s", self.last_midi_note)
                             self.last_midi_note = None
 
-                except queue.Empty:
-                    continue
                 except Exception as e:
                     logger.error(f"MIDI output error: {e}")
                     if self.on_error:
@@ -536,6 +568,12 @@ class AudioToMidiApp:
             if self.on_error:
                 self.on_error(MidiError(f"MIDI output loop error: {e}"))
 
+    def _push_midi(self, event: MidiEvent) -> None:
+        """Hand a note event to the MIDI output thread."""
+        # Note events are rare, so a full ring means the output thread is stuck
+        if not self.queues["midi"].try_push(event):
+            logger.warning(f"MIDI ring full, dropping event: {event}")
+
     def _cleanup_modules(self) -> None:
         """Clean up all modules."""
         if self.audio_capture:
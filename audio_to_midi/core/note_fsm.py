@@ -0,0 +1,151 @@
+"""
+Note detection state machine for the audio processing loop.
+
+This module turns the stream of per-chunk pitch estimates into note on/off
+decisions, applying the debounce, minimum duration and silence release rules
+from the pitch settings.
+"""
+
+import logging
+from typing import Optional, Tuple
+
+from ..config.settings import PitchSettings
+
+logger = logging.getLogger(__name__)
+
+NS_PER_SECOND = 1_000_000_000
+
+# (emit, note): emit is True when a MIDI event should be sent; note is the
+# note to turn on, or None for note off
+NoteEvent = Tuple[bool, Optional[int]]
+
+_NO_EVENT: NoteEvent = (False, None)
+
+
+class NoteStateMachine:
+    """
+    Debounced note on/off tracking for a monophonic pitch stream.
+
+    The thresholds are copied from the pitch settings once and converted to
+    integer nanoseconds, so timestamps from time.monotonic_ns() are compared
+    without float rounding or wall-clock jumps.
+
+    Example:
+        >>> fsm = NoteStateMachine(settings.pitch)
+        >>> emit, note = fsm.on_pitch(midi_note, time.monotonic_ns())
+        >>> emit, note = fsm.on_silence(time.monotonic_ns())
+    """
+
+    __slots__ = (
+        "min_semitone_diff",
+        "debounce_ns",
+        "min_note_duration_ns",
+        "silence_release_ns",
+        "current_note",
+        "last_pitch",
+        "last_pitch_time",
+        "stable_pitch",
+        "stable_pitch_time",
+        "silence_start_time",
+        "_debug",
+    )
+
+    def __init__(self, pitch: PitchSettings) -> None:
+        """
+        Initialize the state machine.
+
+        Args:
+            pitch: Pitch settings providing the debounce and release thresholds
+        """
+        self.min_semitone_diff = pitch.min_semitone_diff
+        self.debounce_ns = round(pitch.debounce_time * NS_PER_SECOND)
+        self.min_note_duration_ns = round(pitch.min_note_duration * NS_PER_SECOND)
+        self.silence_release_ns = round(pitch.silence_release_time * NS_PER_SECOND)
+
+        self.current_note: Optional[int] = None
+        self.last_pitch: Optional[int] = None
+        self.last_pitch_time = 0
+        self.stable_pitch: Optional[int] = None
+        self.stable_pitch_time = 0
+        self.silence_start_time: Optional[int] = None
+
+        # Checked once; avoids formatting debug messages for every chunk
+        self._debug = logger.isEnabledFor(logging.DEBUG)
+
+    def on_silence(self, now: int) -> NoteEvent:
+        """
+        Handle a chunk without a confident pitch.
+
+        Args:
+            now: Monotonic timestamp of the chunk in nanoseconds
+
+        Returns:
+            (True, None) when the current note should be released
+        """
+        if self.current_note is None:
+            return _NO_EVENT
+
+        if self.silence_start_time is None:
+            self.silence_start_time = now
+        elif now - self.silence_start_time >= self.silence_release_ns:
+            self.current_note = None
+            return (True, None)
+        return _NO_EVENT
+
+    def on_pitch(self, midi_note: int, now: int) -> NoteEvent:
+        """
+        Handle a chunk with a confident pitch.
+
+        A note is emitted once it has been stable for the debounce time and
+        the minimum note duration, and differs from the current note.
+
+        Args:
+            midi_note: Detected MIDI note
+            now: Monotonic timestamp of the chunk in nanoseconds
+
+        Returns:
+            (True, midi_note) when the note should be turned on
+        """
+        self.silence_start_time = None
+        event = _NO_EVENT
+
+        if (
+            self.last_pitch is None
+            or abs(midi_note - self.last_pitch) >= self.min_semitone_diff
+        ):
+            self.stable_pitch = midi_note
+            self.stable_pitch_time = now
+            if self._debug:
+                logger.debug(
+                    "Reset stable pitch to %s, last_pitch was %s",
+                    midi_note,
+                    self.last_pitch,
+                )
+        elif (
+            midi_note == self.stable_pitch
+            and now - self.stable_pitch_time >= self.debounce_ns
+        ):
+            # Only send note if it's different from the current note and held for min_note_duration
+            if (
+                self.current_note is None or midi_note != self.current_note
+            ) and now - self.stable_pitch_time >= self.min_note_duration_ns:
+                self.current_note = midi_note
+                event = (True, midi_note)
+            elif self._debug:
+                logger.debug(
+                    "Not sending note %s: current_note=%s, time_held=%.3f",
+                    midi_note,
+                    self.current_note,
+                    (now - self.stable_pitch_time) / NS_PER_SECOND,
+                )
+        elif self._debug:
+            logger.debug(
+                "Note %s not stable yet: stable_pitch=%s, time_since_stable=%.3f",
+                midi_note,
+                self.stable_pitch,
+                (now - self.stable_pitch_time) / NS_PER_SECOND,
+            )
+
+        self.last_pitch = midi_note
+        self.last_pitch_time = now
+        return event
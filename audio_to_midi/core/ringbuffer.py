@@ -0,0 +1,142 @@
+"""
+Single-producer/single-consumer ring buffer for the processing pipeline.
+
+Each stage of the pipeline (capture -> processing -> MIDI output) has exactly
+one writer and one reader, so the hand-off between threads does not need the
+locking that queue.Queue performs on every put/get.
+"""
+
+import threading
+from typing import Any, List, Optional
+
+
+class SPSCRing:
+    """
+    Bounded ring buffer for one producer thread and one consumer thread.
+
+    The producer only advances the write counter and the consumer only
+    advances the read counter. In CPython both are plain int rebinds, which
+    are atomic under the GIL, so neither side takes a lock on the fast path.
+    A threading.Event is used only as a backstop so an idle consumer can
+    block instead of spinning; close() sets it too, so a consumer waiting
+    without a timeout still wakes up on shutdown.
+
+    Items must not be None; None is returned by the pop methods to signal
+    that the ring is empty.
+
+    Example:
+        >>> ring = SPSCRing(4)
+        >>> ring.try_push("chunk")
+        True
+        >>> ring.try_pop()
+        'chunk'
+    """
+
+    __slots__ = ("_capacity", "_slots", "_write", "_read", "_not_empty", "_closed")
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initialize the ring buffer.
+
+        Args:
+            capacity: Maximum number of items held at once
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity < 1:
+            raise ValueError("Ring capacity must be positive")
+
+        self._capacity = capacity
+        # Slots are allocated once; steady state only rebinds references
+        self._slots: List[Any] = [None] * capacity
+        self._write = 0
+        self._read = 0
+        self._not_empty = threading.Event()
+        self._closed = False
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of items the ring can hold."""
+        return self._capacity
+
+    @property
+    def closed(self) -> bool:
+        """Whether close() has been called."""
+        return self._closed
+
+    def __len__(self) -> int:
+        return self._write - self._read
+
+    def try_push(self, item: Any) -> bool:
+        """
+        Append an item without blocking (producer side only).
+
+        Args:
+            item: Item to append (must not be None)
+
+        Returns:
+            True if the item was stored, False if the ring is full
+        """
+        write = self._write
+        if write - self._read >= self._capacity:
+            return False
+
+        self._slots[write % self._capacity] = item
+        # Publish only after the slot is filled
+        self._write = write + 1
+        if not self._not_empty.is_set():
+            self._not_empty.set()
+        return True
+
+    def try_pop(self) -> Optional[Any]:
+        """
+        Remove the oldest item without blocking (consumer side only).
+
+        Returns:
+            The oldest item, or None if the ring is empty
+        """
+        read = self._read
+        if read == self._write:
+            return None
+
+        index = read % self._capacity
+        item = self._slots[index]
+        # Drop the reference so the slot does not keep the item alive
+        self._slots[index] = None
+        self._read = read + 1
+        return item
+
+    def pop(self, timeout: Optional[float] = None) -> Optional[Any]:
+        """
+        Remove the oldest item, waiting up to timeout seconds for one.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None waits forever)
+
+        Returns:
+            The oldest item, or None if the ring stayed empty
+        """
+        item = self.try_pop()
+        if item is not None:
+            return item
+
+        self._not_empty.clear()
+        # Re-check after clearing so a push or close() racing with clear()
+        # is not missed
+        item = self.try_pop()
+        if item is not None or self._closed:
+            return item
+
+        self._not_empty.wait(timeout)
+        return self.try_pop()
+
+    def close(self) -> None:
+        """
+        Wake a consumer blocked in pop() and make further pops non-blocking.
+
+        Items already in the ring can still be popped. Safe to call from any
+        thread.
+        """
+        self._closed = True
+        self._not_empty.set()
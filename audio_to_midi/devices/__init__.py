@@ -18,7 +18,28 @@ Example:
     >>> ports = midi_mgr.list_output_ports()
 """
 
-from .audio_devices import AudioDeviceManager
-from .midi_devices import MidiDeviceManager
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .audio_devices import AudioDeviceManager
+    from .midi_devices import MidiDeviceManager
 
 __all__ = ["AudioDeviceManager", "MidiDeviceManager"]
+
+
+def __getattr__(name: str) -> Any:
+    # Import PyAudio and mido on first access only, so the device cache can
+    # be used without them
+    if name == "AudioDeviceManager":
+        from .audio_devices import AudioDeviceManager
+
+        return AudioDeviceManager
+    if name == "MidiDeviceManager":
+        from .midi_devices import MidiDeviceManager
+
+        return MidiDeviceManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
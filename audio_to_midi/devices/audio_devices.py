@@ -12,9 +12,13 @@ from typing import Any, Dict, List, Optional
 import pyaudio
 
 from ..core.exceptions import DeviceError
+from .cache import device_cache
 
 logger = logging.getLogger(__name__)
 
+# Key of the input device list in the shared enumeration cache
+_CACHE_KEY = "pyaudio.input"
+
 
 @dataclass
 class AudioDevice:
@@ -49,6 +53,7 @@ class AudioDeviceManager:
         """Initialize the audio device manager."""
         self._audio = None
         self._devices_cache: Optional[List[AudioDevice]] = None
+        self._devices_by_name: Dict[str, AudioDevice] = {}
         self._initialize_audio()
 
     def _initialize_audio(self) -> None:
@@ -73,9 +78,15 @@ class AudioDeviceManager:
             DeviceError: If devices cannot be enumerated
         """
         if self._devices_cache is None or refresh:
-            self._refresh_devices()
+            # Other managers may have enumerated moments ago; reuse their result
+            self._devices_cache = device_cache.get(
+                _CACHE_KEY, self._enumerate_devices, refresh
+            )
+            self._devices_by_name = {}
+            for device in self._devices_cache:
+                self._devices_by_name.setdefault(device.name, device)
 
-        return self._devices_cache or []
+        return self._devices_cache
 
     def get_device_by_name(self, name: str) -> Optional[AudioDevice]:
         """
@@ -87,11 +98,8 @@ class AudioDeviceManager:
         Returns:
             AudioDevice if found, None otherwise
         """
-        devices = self.list_input_devices()
-        for device in devices:
-            if device.name == name:
-                return device
-        return None
+        self.list_input_devices()
+        return self._devices_by_name.get(name)
 
     def get_device_by_index(self, index: int) -> Optional[AudioDevice]:
         """
@@ -184,6 +192,18 @@ class AudioDeviceManager:
 
     def _refresh_devices(self) -> None:
         """Refresh the device list."""
+        self.list_input_devices(refresh=True)
+
+    def _enumerate_devices(self) -> List[AudioDevice]:
+        """
+        Enumerate input devices through PyAudio.
+
+        Returns:
+            List of available audio input devices
+
+        Raises:
+            DeviceError: If devices cannot be enumerated
+        """
         if not self._audio:
             raise DeviceError("PyAudio not initialized")
 
@@ -213,12 +233,17 @@ class AudioDeviceManager:
                     logger.warning(f"Failed to get info for device {i}: {e}")
                     continue
 
-            self._devices_cache = devices
             logger.info(f"Found {len(devices)} audio input devices")
+            return devices
 
         except Exception as e:
             raise DeviceError(f"Failed to enumerate audio devices: {e}")
 
+    @property
+    def audio(self) -> Optional[pyaudio.PyAudio]:
+        """PyAudio instance, for components that can share it (None once closed)."""
+        return self._audio
+
     def close(self) -> None:
         """Clean up resources."""
         if self._audio:
@@ -0,0 +1,78 @@
+"""
+Shared cache for device enumeration results.
+
+Enumerating PortAudio devices or MIDI ports can take hundreds of milliseconds
+on systems with many devices, and the lists rarely change while the
+application runs. Results are shared between manager instances and expire
+after a short TTL so newly attached devices still show up.
+"""
+
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds an enumeration result stays valid
+DEFAULT_TTL = 5.0
+
+
+class DeviceEnumerationCache:
+    """
+    Time-limited cache of device lists keyed by backend.
+
+    Example:
+        >>> cache = DeviceEnumerationCache(ttl=5.0)
+        >>> ports = cache.get("mido.output", mido.get_output_names)
+        >>> cache.invalidate("mido.output")  # e.g. from a hotplug handler
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds before a cached result is enumerated again
+        """
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, List[Any]]] = {}
+
+    def get(
+        self, key: str, loader: Callable[[], List[Any]], refresh: bool = False
+    ) -> List[Any]:
+        """
+        Return the cached list for key, enumerating it when missing or stale.
+
+        Args:
+            key: Backend identifier, e.g. "pyaudio.input"
+            loader: Callable that enumerates the devices
+            refresh: Bypass the cache and enumerate again
+
+        Returns:
+            The enumerated device list
+        """
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if not refresh and entry is not None and now - entry[0] < self.ttl:
+            return entry[1]
+
+        devices = loader()
+        self._entries[key] = (now, devices)
+        return devices
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Drop cached results so the next lookup enumerates again.
+
+        Args:
+            key: Backend to invalidate (None invalidates all)
+        """
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+        logger.debug(f"Device enumeration cache invalidated: {key or 'all'}")
+
+
+# Process-wide cache shared by all device managers
+device_cache = DeviceEnumerationCache()
@@ -12,9 +12,14 @@ from typing import Any, Dict, List, Optional
 import mido
 
 from ..core.exceptions import DeviceError
+from .cache import device_cache
 
 logger = logging.getLogger(__name__)
 
+# Keys of the port lists in the shared enumeration cache
+_OUTPUT_CACHE_KEY = "mido.output"
+_INPUT_CACHE_KEY = "mido.input"
+
 
 @dataclass
 class MidiPort:
@@ -48,6 +53,7 @@ class MidiDeviceManager:
     def __init__(self) -> None:
         """Initialize the MIDI device manager."""
         self._ports_cache: Optional[List[MidiPort]] = None
+        self._ports_by_name: Dict[str, MidiPort] = {}
         logger.debug("MIDI device manager initialized")
 
     def list_output_ports(self, refresh: bool = False) -> List[MidiPort]:
@@ -64,9 +70,15 @@ class MidiDeviceManager:
             DeviceError: If ports cannot be enumerated
         """
         if self._ports_cache is None or refresh:
-            self._refresh_ports()
+            # Other managers may have enumerated moments ago; reuse their result
+            self._ports_cache = device_cache.get(
+                _OUTPUT_CACHE_KEY, self._enumerate_ports, refresh
+            )
+            self._ports_by_name = {}
+            for port in self._ports_cache:
+                self._ports_by_name.setdefault(port.name, port)
 
-        return self._ports_cache or []
+        return self._ports_cache
 
     def list_input_ports(self, refresh: bool = False) -> List[MidiPort]:
         """
@@ -75,6 +87,18 @@ class MidiDeviceManager:
         Args:
             refresh: Force refresh of port list
 
+        Returns:
+            List of available MIDI input ports
+
+        Raises:
+            DeviceError: If ports cannot be enumerated
+        """
+        return device_cache.get(_INPUT_CACHE_KEY, self._enumerate_input_ports, refresh)
+
+    def _enumerate_input_ports(self) -> List[MidiPort]:
+        """
+        Enumerate MIDI input ports through mido.
+
         Returns:
             List of available MIDI input ports
 
@@ -110,11 +134,8 @@ class MidiDeviceManager:
         Returns:
             MidiPort if found, None otherwise
         """
-        ports = self.list_output_ports()
-        for port in ports:
-            if port.name == name:
-                return port
-        return None
+        self.list_output_ports()
+        return self._ports_by_name.get(name)
 
     def get_port_by_index(self, index: int) -> Optional[MidiPort]:
         """
@@ -195,6 +216,18 @@ class MidiDeviceManager:
 
     def _refresh_ports(self) -> None:
         """Refresh the port list."""
+        self.list_output_ports(refresh=True)
+
+    def _enumerate_ports(self) -> List[MidiPort]:
+        """
+        Enumerate MIDI output ports through mido.
+
+        Returns:
+            List of available MIDI output ports
+
+        Raises:
+            DeviceError: If ports cannot be enumerated
+        """
         try:
             port_names = mido.get_output_names()
             ports = []
@@ -208,8 +241,8 @@ class MidiDeviceManager:
                 )
                 ports.append(port)
 
-            self._ports_cache = ports
             logger.info(f"Found {len(ports)} MIDI output ports")
+            return ports
 
         except Exception as e:
             raise DeviceError(f"Failed to enumerate MIDI ports: {e}")
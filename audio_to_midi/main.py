@@ -5,35 +5,31 @@ This module provides the main entry point that handles system dependency
 checking and launches the CLI interface.
 """
 
+import functools
+import importlib.util
 import logging
 import sys
+from typing import Tuple
 
-from .cli.commands import cli
-from .utils.helpers import setup_logging
 
-
-def check_system_dependencies() -> list:
+@functools.lru_cache(maxsize=1)
+def check_system_dependencies() -> Tuple[str, ...]:
     """
     Check for required system dependencies.
 
+    The result is cached for the lifetime of the process; installing the
+    system libraries requires a restart anyway.
+
     Returns:
-        List of missing dependencies
+        Tuple of missing dependencies
     """
-    missing = []
-
-    # Check for tkinter
-    try:
-        import tkinter  # noqa: F401
-    except ImportError:
-        missing.append("tkinter")
-
-    # Check for pyaudio
-    try:
-        import pyaudio  # noqa: F401
-    except ImportError:
-        missing.append("pyaudio")
-
-    return missing
+    # find_spec locates the modules without importing or initializing them;
+    # _tkinter is the compiled part that is absent when Tcl/Tk is missing
+    return tuple(
+        name
+        for name, module in (("tkinter", "_tkinter"), ("pyaudio", "pyaudio"))
+        if importlib.util.find_spec(module) is None
+    )
 
 
 def display_dependency_error(missing_deps: list) -> None:
@@ -64,15 +60,15 @@ def display_dependency_error(missing_deps: list) -> None:
 def main() -> None:
     """Main entry point for the Audio to MIDI application."""
     # Check system dependencies first
-    missing_deps = check_system_dependencies()
+    missing_deps = list(check_system_dependencies())
     if missing_deps:
         display_dependency_error(missing_deps)
         sys.exit(1)
 
-    # Setup basic logging
-    setup_logging()
-
+    # Logging is configured by the CLI group once a subcommand is selected
     try:
+        from .cli.commands import cli
+
         # Launch CLI
         cli()
     except KeyboardInterrupt:
@@ -17,7 +17,31 @@ Example:
     >>> midi_out.send_note_on(60, 64)  # Middle C, velocity 64
 """
 
-from .messages import MidiMessageHandler
-from .output import MidiOutput
+from typing import TYPE_CHECKING, Any, List
 
-__all__ = ["MidiOutput", "MidiMessageHandler"]
+if TYPE_CHECKING:
+    from .messages import DEFAULT_HANDLER, MidiMessageHandler
+    from .output import MidiOutput
+
+__all__ = ["MidiOutput", "MidiMessageHandler", "DEFAULT_HANDLER"]
+
+
+def __getattr__(name: str) -> Any:
+    # Import mido (and its rtmidi backend) on first access only
+    if name == "MidiOutput":
+        from .output import MidiOutput
+
+        return MidiOutput
+    if name == "MidiMessageHandler":
+        from .messages import MidiMessageHandler
+
+        return MidiMessageHandler
+    if name == "DEFAULT_HANDLER":
+        from .messages import DEFAULT_HANDLER
+
+        return DEFAULT_HANDLER
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
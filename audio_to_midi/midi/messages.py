@@ -6,14 +6,76 @@ with proper validation and error handling.
 """
 
 import logging
-from typing import Any, Dict
+import operator
+from typing import Any, Callable, Dict, FrozenSet, Tuple, Union
 
 import mido
+import numpy as np
 
 from ..core.exceptions import MidiError
+from ..utils.helpers import midi_note_to_name
 
 logger = logging.getLogger(__name__)
 
+# Messages are built with skip_checks=True: the create_* methods validate the
+# arguments first, so mido's own range checks would only run twice
+
+# Range errors shared by the inlined checks in create_* and the _validate_*
+# helpers. x & ~0x7F is non-zero exactly when an int x is outside 0-127
+# (negative ints have the high bits set), so each check is a single operation.
+# Values are first converted with operator.index, so NumPy integers become
+# plain ints (& on unsigned NumPy scalars raises OverflowError) and anything
+# that is not an integer raises TypeError, reported as _TYPE_ERROR.
+_NOTE_ERROR = "MIDI note must be between 0 and 127"
+_VELOCITY_ERROR = "MIDI velocity must be between 1 and 127"
+_RELEASE_VELOCITY_ERROR = "MIDI velocity must be between 0 and 127"
+_CHANNEL_ERROR = "MIDI channel must be between 0 and 15"
+_CONTROL_ERROR = "MIDI control number must be between 0 and 127"
+_VALUE_ERROR = "MIDI value must be between 0 and 127"
+_PITCH_BEND_ERROR = "Pitch bend value must be between -8192 and 8191"
+_PROGRAM_ERROR = "MIDI program number must be between 0 and 127"
+_SYSEX_DATA_ERROR = "SysEx data bytes must be between 0 and 127"
+_TYPE_ERROR = "MIDI message values must be integers"
+
+SysExData = Union[bytes, bytearray, memoryview]
+_SYSEX_BUFFER_TYPES = (bytes, bytearray, memoryview)
+
+# Payloads longer than this are range checked with NumPy; below it the
+# builtin max() over the buffer is cheaper than creating an array view
+_SYSEX_NUMPY_THRESHOLD = 64
+
+
+def _sysex_payload(data: Any) -> Any:
+    """Return SysEx data from a message dict, copying only non-buffer input."""
+    return data if isinstance(data, _SYSEX_BUFFER_TYPES) else bytes(data)
+
+
+class _TrustedMessage(mido.Message):
+    """
+    mido.Message that records whether its fields are known to be valid.
+
+    validate_message() accepts trusted messages without re-checking every
+    field. Assigning to any message attribute clears the flag, and copies
+    start out untrusted, so only messages built by _trusted_message() skip
+    validation.
+    """
+
+    __slots__ = ("_trusted",)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "_trusted":
+            object.__setattr__(self, name, value)
+        else:
+            object.__setattr__(self, "_trusted", False)
+            super().__setattr__(name, value)
+
+
+def _trusted_message(message_type: str, **args: Any) -> mido.Message:
+    """Build a message from arguments already validated by the handler."""
+    message = _TrustedMessage(message_type, **args)
+    message._trusted = True
+    return message
+
 
 class MidiMessageHandler:
     """
@@ -29,9 +91,104 @@ class MidiMessageHandler:
         >>> is_valid = handler.validate_message(note_on)
     """
 
-    def __init__(self) -> None:
-        """Initialize the MIDI message handler."""
-        logger.debug("MIDI message handler initialized")
+    # Message types accepted by validate_message
+    _VALID_TYPES: FrozenSet[str] = frozenset(
+        (
+            "note_on",
+            "note_off",
+            "control_change",
+            "pitchwheel",
+            "program_change",
+            "aftertouch",
+            "sysex",
+        )
+    )
+    _NOTE_TYPES: FrozenSet[str] = frozenset(("note_on", "note_off"))
+
+    # Message type -> exporter used by message_to_dict; each builds its dict
+    # in one expression instead of looping over field names
+    _TO_DICT: Dict[str, Callable[[mido.Message], Dict[str, Any]]] = {
+        "note_on": lambda m: {
+            "type": "note_on",
+            "note": m.note,
+            "velocity": m.velocity,
+            "channel": m.channel,
+        },
+        "note_off": lambda m: {
+            "type": "note_off",
+            "note": m.note,
+            "velocity": m.velocity,
+            "channel": m.channel,
+        },
+        "control_change": lambda m: {
+            "type": "control_change",
+            "control": m.control,
+            "value": m.value,
+            "channel": m.channel,
+        },
+        "pitchwheel": lambda m: {
+            "type": "pitchwheel",
+            "pitch": m.pitch,
+            "channel": m.channel,
+        },
+        "program_change": lambda m: {
+            "type": "program_change",
+            "program": m.program,
+            "channel": m.channel,
+        },
+        "aftertouch": lambda m: {
+            "type": "aftertouch",
+            "value": m.value,
+            "channel": m.channel,
+        },
+        "sysex": lambda m: {"type": "sysex", "data": list(m.data)},
+    }
+    # Fields probed for message types outside the table above
+    _OPTIONAL_FIELDS: Tuple[str, ...] = (
+        "note",
+        "velocity",
+        "control",
+        "value",
+        "pitch",
+        "program",
+        "channel",
+    )
+
+    # Common control change names reported by get_message_info
+    _CC_NAMES: Dict[int, str] = {
+        1: "Modulation",
+        7: "Volume",
+        10: "Pan",
+        11: "Expression",
+        64: "Sustain Pedal",
+        123: "All Notes Off",
+    }
+
+    # Message type -> builder used by dict_to_message; one lookup per message
+    _FROM_DICT: Dict[str, Callable[[Any, Dict[str, Any]], mido.Message]] = {
+        "note_on": lambda self, data: self.create_note_on(
+            data["note"], data["velocity"], data.get("channel", 0)
+        ),
+        "note_off": lambda self, data: self.create_note_off(
+            data["note"], data.get("velocity", 0), data.get("channel", 0)
+        ),
+        "control_change": lambda self, data: self.create_control_change(
+            data["control"], data["value"], data.get("channel", 0)
+        ),
+        # mido stores pitch as signed (-8192..8191), as does message_to_dict
+        "pitchwheel": lambda self, data: self.create_pitch_bend(
+            data["pitch"], data.get("channel", 0)
+        ),
+        "program_change": lambda self, data: self.create_program_change(
+            data["program"], data.get("channel", 0)
+        ),
+        "aftertouch": lambda self, data: self.create_channel_pressure(
+            data["value"], data.get("channel", 0)
+        ),
+        "sysex": lambda self, data: self.create_system_exclusive(
+            _sysex_payload(data["data"])
+        ),
+    }
 
     def create_note_on(
         self, note: int, velocity: int, channel: int = 0
@@ -50,20 +207,33 @@ class MidiMessageHandler:
         Raises:
             MidiError: If parameters are invalid
         """
-        self._validate_note(note)
-        self._validate_velocity(velocity)
-        self._validate_channel(channel)
-
         try:
-            message = mido.Message(
-                "note_on", note=note, velocity=velocity, channel=channel
-            )
-            logger.debug(
-                f"Created note on: note={note}, velocity={velocity}, channel={channel}"
-            )
-            return message
-        except Exception as e:
-            raise MidiError(f"Failed to create note on message: {e}")
+            note = operator.index(note)
+            velocity = operator.index(velocity)
+            channel = operator.index(channel)
+            if note & ~0x7F:
+                raise MidiError(_NOTE_ERROR)
+            if velocity & ~0x7F or not velocity:
+                raise MidiError(_VELOCITY_ERROR)
+            if channel & ~0x0F:
+                raise MidiError(_CHANNEL_ERROR)
+        except TypeError:
+            raise MidiError(_TYPE_ERROR) from None
+
+        message = _trusted_message(
+            "note_on",
+            skip_checks=True,
+            note=note,
+            velocity=velocity,
+            channel=channel,
+        )
+        logger.debug(
+            "Created note on: note=%s, velocity=%s, channel=%s",
+            note,
+            velocity,
+            channel,
+        )
+        return message
 
     def create_note_off(
         self, note: int, velocity: int = 0, channel: int = 0
@@ -82,20 +252,33 @@ class MidiMessageHandler:
         Raises:
             MidiError: If parameters are invalid
         """
-        self._validate_note(note)
-        self._validate_velocity(velocity, allow_zero=True)
-        self._validate_channel(channel)
-
         try:
-            message = mido.Message(
-                "note_off", note=note, velocity=velocity, channel=channel
-            )
-            logger.debug(
-                f"Created note off: note={note}, velocity={velocity}, channel={channel}"
-            )
-            return message
-        except Exception as e:
-            raise MidiError(f"Failed to create note off message: {e}")
+            note = operator.index(note)
+            velocity = operator.index(velocity)
+            channel = operator.index(channel)
+            if note & ~0x7F:
+                raise MidiError(_NOTE_ERROR)
+            if velocity & ~0x7F:
+                raise MidiError(_RELEASE_VELOCITY_ERROR)
+            if channel & ~0x0F:
+                raise MidiError(_CHANNEL_ERROR)
+        except TypeError:
+            raise MidiError(_TYPE_ERROR) from None
+
+        message = _trusted_message(
+            "note_off",
+            skip_checks=True,
+            note=note,
+            velocity=velocity,
+            channel=channel,
+        )
+        logger.debug(
+            "Created note off: note=%s, velocity=%s, channel=%s",
+            note,
+            velocity,
+            channel,
+        )
+        return message
 
     def create_control_change(
         self, control: int, value: int, channel: int = 0
@@ -114,20 +297,33 @@ class MidiMessageHandler:
         Raises:
             MidiError: If parameters are invalid
         """
-        self._validate_control(control)
-        self._validate_value(value)
-        self._validate_channel(channel)
-
         try:
-            message = mido.Message(
-                "control_change", control=control, value=value, channel=channel
-            )
-            logger.debug(
-                f"Created control change: control={control}, value={value}, channel={channel}"
-            )
-            return message
-        except Exception as e:
-            raise MidiError(f"Failed to create control change message: {e}")
+            control = operator.index(control)
+            value = operator.index(value)
+            channel = operator.index(channel)
+            if control & ~0x7F:
+                raise MidiError(_CONTROL_ERROR)
+            if value & ~0x7F:
+                raise MidiError(_VALUE_ERROR)
+            if channel & ~0x0F:
+                raise MidiError(_CHANNEL_ERROR)
+        except TypeError:
+            raise MidiError(_TYPE_ERROR) from None
+
+        message = _trusted_message(
+            "control_change",
+            skip_checks=True,
+            control=control,
+            value=value,
+            channel=channel,
+        )
+        logger.debug(
+            "Created control change: control=%s, value=%s, channel=%s",
+            control,
+            value,
+            channel,
+        )
+        return message
 
     def create_pitch_bend(self, value: int, channel: int = 0) -> mido.Message:
         """
@@ -143,17 +339,22 @@ class MidiMessageHandler:
         Raises:
             MidiError: If parameters are invalid
         """
-        self._validate_pitch_bend(value)
-        self._validate_channel(channel)
-
         try:
-            # Convert from signed to unsigned 14-bit value
-            unsigned_value = value + 8192
-            message = mido.Message("pitchwheel", pitch=unsigned_value, channel=channel)
-            logger.debug(f"Created pitch bend: value={value}, channel={channel}")
-            return message
-        except Exception as e:
-            raise MidiError(f"Failed to create pitch bend message: {e}")
+            value = operator.index(value)
+            channel = operator.index(channel)
+            if (value + 8192) & ~0x3FFF:
+                raise MidiError(_PITCH_BEND_ERROR)
+            if channel & ~0x0F:
+                raise MidiError(_CHANNEL_ERROR)
+        except TypeError:
+            raise MidiError(_TYPE_ERROR) from None
+
+        # mido takes the signed value and encodes the 14-bit field itself
+        message = _trusted_message(
+            "pitchwheel", pitch=value, channel=channel, skip_checks=True
+        )
+        logger.debug("Created pitch bend: value=%s, channel=%s", value, channel)
+        return message
 
     def create_program_change(self, program: int, channel: int = 0) -> mido.Message:
         """
@@ -169,17 +370,21 @@ class MidiMessageHandler:
         Raises:
             MidiError: If parameters are invalid
         """
-        self._validate_program(program)
-        self._validate_channel(channel)
-
         try:
-            message = mido.Message("program_change", program=program, channel=channel)
-            logger.debug(
-                f"Created program change: program={program}, channel={channel}"
-            )
-            return message
-        except Exception as e:
-            raise MidiError(f"Failed to create program change message: {e}")
+            program = operator.index(program)
+            channel = operator.index(channel)
+            if program & ~0x7F:
+                raise MidiError(_PROGRAM_ERROR)
+            if channel & ~0x0F:
+                raise MidiError(_CHANNEL_ERROR)
+        except TypeError:
+            raise MidiError(_TYPE_ERROR) from None
+
+        message = _trusted_message(
+            "program_change", skip_checks=True, program=program, channel=channel
+        )
+        logger.debug("Created program change: program=%s, channel=%s", program, channel)
+        return message
 
     def create_channel_pressure(self, value: int, channel: int = 0) -> mido.Message:
         """
@@ -195,22 +400,85 @@ class MidiMessageHandler:
         Raises:
             MidiError: If parameters are invalid
         """
-        self._validate_value(value)
-        self._validate_channel(channel)
-
         try:
-            message = mido.Message("aftertouch", value=value, channel=channel)
-            logger.debug(f"Created channel pressure: value={value}, channel={channel}")
-            return message
-        except Exception as e:
-            raise MidiError(f"Failed to create channel pressure message: {e}")
+            value = operator.index(value)
+            channel = operator.index(channel)
+            if value & ~0x7F:
+                raise MidiError(_VALUE_ERROR)
+            if channel & ~0x0F:
+                raise MidiError(_CHANNEL_ERROR)
+        except TypeError:
+            raise MidiError(_TYPE_ERROR) from None
+
+        message = _trusted_message(
+            "aftertouch", skip_checks=True, value=value, channel=channel
+        )
+        logger.debug("Created channel pressure: value=%s, channel=%s", value, channel)
+        return message
+
+    def create_note_events_bulk(
+        self, notes: np.ndarray, velocities: np.ndarray, channels: np.ndarray
+    ) -> np.ndarray:
+        """
+        Encode many note on/off events at once.
+
+        Events with velocity 0 are encoded as note off, all others as note on.
+        Use mido.Message.from_bytes on a row if a mido message is needed.
+
+        Args:
+            notes: MIDI note numbers (0-127)
+            velocities: Note velocities (0-127)
+            channels: MIDI channels (0-15)
+
+        Returns:
+            Array of shape (n, 3) and dtype uint8 holding the raw MIDI bytes
+            (status, note, velocity) of each event
 
-    def create_system_exclusive(self, data: bytes) -> mido.Message:
+        Raises:
+            MidiError: If the arrays differ in length, are not integer arrays
+                or any value is invalid
+        """
+        notes = np.asarray(notes)
+        velocities = np.asarray(velocities)
+        channels = np.asarray(channels)
+        if not (notes.shape == velocities.shape == channels.shape) or notes.ndim != 1:
+            raise MidiError(
+                "Notes, velocities and channels must be 1-D and equal length"
+            )
+        if not all(
+            np.issubdtype(values.dtype, np.integer)
+            for values in (notes, velocities, channels)
+        ):
+            # Float input would otherwise be truncated by the uint8 cast
+            raise MidiError(_TYPE_ERROR)
+
+        for name, values, upper in (
+            ("note", notes, 127),
+            ("velocity", velocities, 127),
+            ("channel", channels, 15),
+        ):
+            invalid = (values < 0) | (values > upper)
+            if invalid.any():
+                index = int(np.argmax(invalid))
+                raise MidiError(
+                    f"MIDI {name} must be between 0 and {upper} (event {index})"
+                )
+
+        events = np.empty((len(notes), 3), dtype=np.uint8)
+        events[:, 0] = np.where(velocities > 0, 0x90, 0x80) | channels
+        events[:, 1] = notes
+        events[:, 2] = velocities
+        return events
+
+    def create_system_exclusive(self, data: SysExData) -> mido.Message:
         """
         Create a system exclusive message.
 
+        The data is handed to mido without an intermediate copy; mido stores
+        its own immutable copy of the bytes.
+
         Args:
-            data: SysEx data bytes
+            data: SysEx data bytes, excluding the F0/F7 framing
 
         Returns:
             MIDI system exclusive message
@@ -218,12 +486,18 @@ class MidiMessageHandler:
         Raises:
             MidiError: If data is invalid
         """
-        if not isinstance(data, (bytes, bytearray)):
-            raise MidiError("SysEx data must be bytes or bytearray")
+        if isinstance(data, memoryview):
+            # Iterate raw bytes whatever the item format of the view
+            data = data.cast("B")
+        elif not isinstance(data, (bytes, bytearray)):
+            raise MidiError("SysEx data must be bytes, bytearray or memoryview")
+
+        self._validate_sysex_payload(data)
 
         try:
-            message = mido.Message("sysex", data=data)
-            logger.debug(f"Created SysEx message: {len(data)} bytes")
+            # Payload checked above; mido would check each byte in Python
+            message = _trusted_message("sysex", skip_checks=True, data=data)
+            logger.debug("Created SysEx message: %d bytes", len(data))
             return message
         except Exception as e:
             raise MidiError(f"Failed to create SysEx message: {e}")
@@ -244,46 +518,45 @@ class MidiMessageHandler:
         if not isinstance(message, mido.Message):
             raise MidiError("Invalid message type")
 
+        # Messages from create_* were validated when they were built
+        if getattr(message, "_trusted", False):
+            return True
+
         try:
             # Check message type
-            if message.type not in [
-                "note_on",
-                "note_off",
-                "control_change",
-                "pitchwheel",
-                "program_change",
-                "aftertouch",
-                "sysex",
-            ]:
-                raise MidiError(f"Unsupported message type: {message.type}")
+            message_type = message.type
+            if message_type not in self._VALID_TYPES:
+                raise MidiError(f"Unsupported message type: {message_type}")
 
             # Validate message-specific parameters
-            if message.type in ["note_on", "note_off"]:
+            if message_type in self._NOTE_TYPES:
                 self._validate_note(message.note)
                 self._validate_velocity(
-                    message.velocity, allow_zero=(message.type == "note_off")
+                    message.velocity, allow_zero=(message_type == "note_off")
                 )
                 self._validate_channel(message.channel)
 
-            elif message.type == "control_change":
+            elif message_type == "control_change":
                 self._validate_control(message.control)
                 self._validate_value(message.value)
                 self._validate_channel(message.channel)
 
-            elif message.type == "pitchwheel":
-                # Pitch wheel values are 0-16383 (14-bit)
-                if not (0 <= message.pitch <= 16383):
-                    raise MidiError("Pitch wheel value must be between 0 and 16383")
+            elif message_type == "pitchwheel":
+                self._validate_pitch_bend(message.pitch)
                 self._validate_channel(message.channel)
 
-            elif message.type == "program_change":
+            elif message_type == "program_change":
                 self._validate_program(message.program)
                 self._validate_channel(message.channel)
 
-            elif message.type == "aftertouch":
+            elif message_type == "aftertouch":
                 self._validate_value(message.value)
                 self._validate_channel(message.channel)
 
+            elif message_type == "sysex":
+                # bytes() rejects values outside 0-255
+                self._validate_sysex_payload(bytes(message.data))
+
             return True
 
         except Exception as e:
@@ -299,25 +572,15 @@ class MidiMessageHandler:
         Returns:
             Dictionary representation of message
         """
-        result = {"type": message.type}
-
-        # Add message-specific fields
-        for attr in [
-            "note",
-            "velocity",
-            "control",
-            "value",
-            "pitch",
-            "program",
-            "channel",
-        ]:
+        message_type = message.type
+        exporter = self._TO_DICT.get(message_type)
+        if exporter is not None:
+            return exporter(message)
+
+        result = {"type": message_type}
+        for attr in self._OPTIONAL_FIELDS:
             if hasattr(message, attr):
                 result[attr] = getattr(message, attr)
-
-        # Special handling for SysEx
-        if message.type == "sysex":
-            result["data"] = list(message.data)
-
         return result
 
     def dict_to_message(self, data: Dict[str, Any]) -> mido.Message:
@@ -333,79 +596,103 @@ class MidiMessageHandler:
         Raises:
             MidiError: If data is invalid
         """
-        if "type" not in data:
+        message_type = data.get("type")
+        if message_type is None:
             raise MidiError("Message type is required")
 
-        message_type = data["type"]
+        builder = self._FROM_DICT.get(message_type)
+        if builder is None:
+            raise MidiError(f"Unsupported message type: {message_type}")
 
         try:
-            if message_type == "note_on":
-                return self.create_note_on(
-                    data["note"], data["velocity"], data.get("channel", 0)
-                )
-            elif message_type == "note_off":
-                return self.create_note_off(
-                    data["note"], data.get("velocity", 0), data.get("channel", 0)
-                )
-            elif message_type == "control_change":
-                return self.create_control_change(
-                    data["control"], data["value"], data.get("channel", 0)
-                )
-            elif message_type == "pitchwheel":
-                # Convert from 14-bit unsigned to signed
-                signed_value = data["pitch"] - 8192
-                return self.create_pitch_bend(signed_value, data.get("channel", 0))
-            elif message_type == "program_change":
-                return self.create_program_change(
-                    data["program"], data.get("channel", 0)
-                )
-            elif message_type == "aftertouch":
-                return self.create_channel_pressure(
-                    data["value"], data.get("channel", 0)
-                )
-            elif message_type == "sysex":
-                return self.create_system_exclusive(bytes(data["data"]))
-            else:
-                raise MidiError(f"Unsupported message type: {message_type}")
-
+            return builder(self, data)
         except KeyError as e:
             raise MidiError(f"Missing required field: {e}")
+        except TypeError as e:
+            raise MidiError(f"Invalid field value: {e}")
 
-    def _validate_note(self, note: int) -> None:
+    @staticmethod
+    def _validate_note(note: int) -> None:
         """Validate MIDI note number."""
-        if not (0 <= note <= 127):
-            raise MidiError("MIDI note must be between 0 and 127")
-
-    def _validate_velocity(self, velocity: int, allow_zero: bool = False) -> None:
+        try:
+            note = operator.index(note)
+            if note & ~0x7F:
+                raise MidiError(_NOTE_ERROR)
+        except TypeError:
+            raise MidiError(_TYPE_ERROR) from None
+
+    @staticmethod
+    def _validate_velocity(velocity: int, allow_zero: bool = False) -> None:
         """Validate MIDI velocity."""
-        min_vel = 0 if allow_zero else 1
-        if not (min_vel <= velocity <= 127):
-            raise MidiError(f"MIDI velocity must be between {min_vel} and 127")
-
-    def _validate_channel(self, channel: int) -> None:
+        try:
+            velocity = operator.index(velocity)
+            if allow_zero:
+                if velocity & ~0x7F:
+                    raise MidiError(_RELEASE_VELOCITY_ERROR)
+            elif velocity & ~0x7F or not velocity:
+                raise MidiError(_VELOCITY_ERROR)
+        except TypeError:
+            raise MidiError(_TYPE_ERROR) from None
+
+    @staticmethod
+    def _validate_channel(channel: int) -> None:
         """Validate MIDI channel."""
-        if not (0 <= channel <= 15):
-            raise MidiError("MIDI channel must be between 0 and 15")
-
-    def _validate_control(self, control: int) -> None:
+        try:
+            channel = operator.index(channel)
+            if channel & ~0x0F:
+                raise MidiError(_CHANNEL_ERROR)
+        except TypeError:
+            raise MidiError(_TYPE_ERROR) from None
+
+    @staticmethod
+    def _validate_control(control: int) -> None:
         """Validate MIDI control number."""
-        if not (0 <= control <= 127):
-            raise MidiError("MIDI control number must be between 0 and 127")
-
-    def _validate_value(self, value: int) -> None:
+        try:
+            control = operator.index(control)
+            if control & ~0x7F:
+                raise MidiError(_CONTROL_ERROR)
+        except TypeError:
+            raise MidiError(_TYPE_ERROR) from None
+
+    @staticmethod
+    def _validate_value(value: int) -> None:
         """Validate MIDI value."""
-        if not (0 <= value <= 127):
-            raise MidiError("MIDI value must be between 0 and 127")
-
-    def _validate_pitch_bend(self, value: int) -> None:
+        try:
+            value = operator.index(value)
+            if value & ~0x7F:
+                raise MidiError(_VALUE_ERROR)
+        except TypeError:
+            raise MidiError(_TYPE_ERROR) from None
+
+    @staticmethod
+    def _validate_pitch_bend(value: int) -> None:
         """Validate pitch bend value."""
-        if not (-8192 <= value <= 8191):
-            raise MidiError("Pitch bend value must be between -8192 and 8191")
-
-    def _validate_program(self, program: int) -> None:
+        try:
+            value = operator.index(value)
+            if (value + 8192) & ~0x3FFF:
+                raise MidiError(_PITCH_BEND_ERROR)
+        except TypeError:
+            raise MidiError(_TYPE_ERROR) from None
+
+    @staticmethod
+    def _validate_sysex_payload(data: SysExData) -> None:
+        """Validate SysEx data bytes (buffer items are always 0-255)."""
+        if len(data) > _SYSEX_NUMPY_THRESHOLD:
+            highest = int(np.frombuffer(data, dtype=np.uint8).max())
+        else:
+            highest = max(data, default=0)
+        if highest & 0x80:
+            raise MidiError(_SYSEX_DATA_ERROR)
+
+    @staticmethod
+    def _validate_program(program: int) -> None:
         """Validate MIDI program number."""
-        if not (0 <= program <= 127):
-            raise MidiError("MIDI program number must be between 0 and 127")
+        try:
+            program = operator.index(program)
+            if program & ~0x7F:
+                raise MidiError(_PROGRAM_ERROR)
+        except TypeError:
+            raise MidiError(_TYPE_ERROR) from None
 
     def get_message_info(self, message: mido.Message) -> Dict[str, Any]:
         """
@@ -420,26 +707,14 @@ class MidiMessageHandler:
         info = self.message_to_dict(message)
 
         # Add human-readable descriptions
-        if message.type == "note_on":
-            from ..utils.helpers import midi_note_to_name
-
-            info["note_name"] = midi_note_to_name(message.note)
-
-        elif message.type == "note_off":
-            from ..utils.helpers import midi_note_to_name
-
+        if message.type in self._NOTE_TYPES:
             info["note_name"] = midi_note_to_name(message.note)
 
         elif message.type == "control_change":
-            # Add common control change names
-            cc_names = {
-                1: "Modulation",
-                7: "Volume",
-                10: "Pan",
-                11: "Expression",
-                64: "Sustain Pedal",
-                123: "All Notes Off",
-            }
-            info["control_name"] = cc_names.get(message.control, "Unknown")
+            info["control_name"] = self._CC_NAMES.get(message.control, "Unknown")
 
         return info
+
+
+# Shared handler; it holds no state, so one instance serves every caller
+DEFAULT_HANDLER = MidiMessageHandler()
@@ -13,7 +13,7 @@ from typing import Callable, Optional, Set
 import mido
 
 from ..core.exceptions import MidiError
-from .messages import MidiMessageHandler
+from .messages import DEFAULT_HANDLER
 
 logger = logging.getLogger(__name__)
 
@@ -47,11 +47,17 @@ class MidiOutput:
         self._connection_lock = threading.Lock()
 
         # Message handling
-        self.message_handler = MidiMessageHandler()
+        self.message_handler = DEFAULT_HANDLER
 
-        # Note tracking
+        # Note tracking; reentrant because note offs are also sent while the
+        # lock is held (retriggered notes, all notes off)
         self._active_notes: Set[int] = set()
-        self._note_lock = threading.Lock()
+        self._note_lock = threading.RLock()
+
+        # Reused note messages; only the note (and velocity) change per event.
+        # Ports send a copy, and the lock serializes updates to them
+        self._note_on_message = self._build_note_on_message()
+        self._note_off_message = self._build_note_off_message()
 
         # Callbacks
         self.on_connect: Optional[Callable] = None
@@ -92,6 +98,10 @@ class MidiOutput:
         self.velocity = velocity
         self.transpose = transpose
 
+        with self._note_lock:
+            self._note_on_message = self._build_note_on_message()
+            self._note_off_message = self._build_note_off_message()
+
         logger.info(f"MIDI output configured: {port_name}, channel {channel}")
 
     def connect(self) -> bool:
@@ -191,9 +201,13 @@ class MidiOutput:
                     self._send_note_off_internal(transposed_note)
 
                 # Send note on
-                message = self.message_handler.create_note_on(
-                    transposed_note, velocity, self.channel
-                )
+                if velocity == self.velocity:
+                    message = self._note_on_message
+                    message.note = transposed_note
+                else:
+                    message = self.message_handler.create_note_on(
+                        transposed_note, velocity, self.channel
+                    )
                 self._output_port.send(message)
 
                 self._active_notes.add(transposed_note)
@@ -233,10 +247,11 @@ class MidiOutput:
     def _send_note_off_internal(self, note: int) -> bool:
         """Internal note off implementation."""
         try:
-            message = self.message_handler.create_note_off(note, 0, self.channel)
-            self._output_port.send(message)
-
             with self._note_lock:
+                message = self._note_off_message
+                message.note = note
+                self._output_port.send(message)
+
                 self._active_notes.discard(note)
 
             logger.debug(f"Note off: {note}")
@@ -249,6 +264,14 @@ class MidiOutput:
             self._handle_connection_error()
             return False
 
+    def _build_note_on_message(self) -> mido.Message:
+        """Create the reusable note on message for the current settings."""
+        return self.message_handler.create_note_on(0, self.velocity, self.channel)
+
+    def _build_note_off_message(self) -> mido.Message:
+        """Create the reusable note off message for the current settings."""
+        return self.message_handler.create_note_off(0, 0, self.channel)
+
     def send_all_notes_off(self) -> bool:
         """
         Send all notes off message.
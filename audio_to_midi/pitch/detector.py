@@ -6,10 +6,11 @@ real-time vocal input with confidence scoring and filtering.
 """
 
 import logging
-from typing import List, Optional, Tuple
+import math
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
-from scipy import signal
+from scipy.fft import irfft, next_fast_len, rfft
 
 from ..core.exceptions import PitchDetectionError
 from ..utils.helpers import frequency_to_midi_note
@@ -34,11 +35,11 @@ class PitchDetector:
 
     def __init__(self) -> None:
         """Initialize the pitch detector."""
-        self.sample_rate: int = 44100
+        self.sample_rate: float = 44100
         self.min_freq: float = 80.0
         self.max_freq: float = 800.0
         self.confidence_threshold: float = 0.8
-        self.algorithm: str = "autocorrelation"
+        self.algorithm: str = "yin"
 
         # Smoothing parameters
         self.smoothing_enabled: bool = True
@@ -48,15 +49,24 @@ class PitchDetector:
         # Octave correction
         self.octave_correction: bool = True
 
+        # YIN: CMNDF dip threshold (lower is stricter)
+        self.yin_threshold: float = 0.1
+
+        # Minimum length -> fast FFT size, cached per chunk size
+        self._fft_sizes: Dict[int, int] = {}
+
+        # Set once a chunk too short for min_freq has been reported
+        self._short_window_warned = False
+
         logger.debug("Pitch detector initialized")
 
     def configure(
         self,
-        sample_rate: int = 44100,
+        sample_rate: float = 44100,
         min_freq: float = 80.0,
         max_freq: float = 800.0,
         confidence_threshold: float = 0.8,
-        algorithm: str = "autocorrelation",
+        algorithm: str = "yin",
     ) -> None:
         """
         Configure pitch detection parameters.
@@ -87,6 +97,7 @@ class PitchDetector:
         self.max_freq = max_freq
         self.confidence_threshold = confidence_threshold
         self.algorithm = algorithm
+        self._short_window_warned = False
 
         logger.info(
             f"Pitch detector configured: {min_freq}-{max_freq}Hz, threshold={confidence_threshold}"
@@ -108,8 +119,9 @@ class PitchDetector:
         if audio_data is None or len(audio_data) == 0:
             return None, 0.0
 
-        # Check if audio is above silence threshold
-        if np.max(np.abs(audio_data)) < 0.01:
+        # Check if audio is above silence threshold; max/min avoid allocating
+        # an abs() copy of the chunk
+        if max(audio_data.max(), -audio_data.min()) < 0.01:
             return None, 0.0
 
         try:
@@ -122,8 +134,13 @@ class PitchDetector:
             else:
                 raise PitchDetectionError(f"Unknown algorithm: {self.algorithm}")
 
-            # Apply octave correction if enabled
-            if self.octave_correction and frequency is not None:
+            # Apply octave correction if enabled; YIN picks the first CMNDF
+            # dip, so it does not produce the octave errors this patches
+            if (
+                self.octave_correction
+                and frequency is not None
+                and self.algorithm != "yin"
+            ):
                 frequency = self._apply_octave_correction(frequency, audio_data)
 
             # Apply smoothing if enabled
@@ -144,39 +161,59 @@ class PitchDetector:
         """
         Detect pitch using autocorrelation method.
 
+        Takes the strongest autocorrelation peak within the frequency range
+        and refines its lag with parabolic interpolation.
+
         Args:
             audio_data: Audio data
 
         Returns:
             Tuple of (frequency, confidence)
         """
-        # Compute autocorrelation
-        autocorr = np.correlate(audio_data, audio_data, mode="full")
-        autocorr = autocorr[len(autocorr) // 2 :]
-
-        # Find peaks in autocorrelation
-        peaks, properties = signal.find_peaks(
-            autocorr,
-            height=np.max(autocorr) * 0.1,
-            distance=int(self.sample_rate / self.max_freq),
-        )
+        # Compute autocorrelation via the power spectrum (Wiener-Khinchin);
+        # padding to at least 2n - 1 makes the circular result linear
+        n = len(audio_data)
+        fft_size = self._fft_size(2 * n - 1)
+        spectrum = rfft(audio_data, fft_size)
+        autocorr = irfft(spectrum.real**2 + spectrum.imag**2, fft_size)[:n]
+
+        # Only lags inside the frequency range can hold the pitch period
+        lag_min = max(1, int(self.sample_rate / self.max_freq))
+        lag_max = min(n - 1, int(self.sample_rate / self.min_freq))
+        if lag_max <= lag_min + 1:
+            return None, 0.0
+        lags = autocorr[lag_min : lag_max + 1]
+
+        # Skip the tail of the zero-lag lobe, which can reach into the range
+        # for low pitches, then take the strongest peak after it
+        rising = np.flatnonzero(lags[1:] > lags[:-1])
+        if len(rising) == 0:
+            return None, 0.0
+        start = int(rising[0])
+        peak = start + int(lags[start:].argmax())
 
-        if len(peaks) == 0:
+        # A maximum at the end of the range is not a peak; the zero-lag term
+        # (the signal energy) is always the overall maximum
+        peak_max = autocorr[0]
+        if peak == len(lags) - 1 or lags[peak] < peak_max * 0.1:
             return None, 0.0
 
-        # Find the first significant peak within frequency range
-        for peak in peaks:
-            if peak > 0:
-                frequency = self.sample_rate / peak
-                if self.min_freq <= frequency <= self.max_freq:
-                    confidence = autocorr[peak] / np.max(autocorr)
-                    return frequency, confidence
+        # Parabolic interpolation around the peak for sub-sample lag precision
+        previous, current, following = lags[peak - 1 : peak + 2]
+        curvature = previous - 2.0 * current + following
+        shift = 0.5 * (previous - following) / curvature if curvature < 0 else 0.0
 
-        return None, 0.0
+        frequency = float(self.sample_rate) / (lag_min + peak + shift)
+        return frequency, float(current / peak_max)
 
     def _yin_pitch(self, audio_data: np.ndarray) -> Tuple[Optional[float], float]:
         """
-        Detect pitch using YIN algorithm.
+        Detect pitch using the YIN algorithm.
+
+        Computes the cumulative mean normalized difference function (CMNDF)
+        over the lags allowed by the frequency range, takes the first dip
+        below yin_threshold (or the global minimum if there is none) and
+        refines it with parabolic interpolation.
 
         Args:
             audio_data: Audio data
@@ -184,38 +221,67 @@ class PitchDetector:
         Returns:
             Tuple of (frequency, confidence)
         """
-        # Simplified YIN implementation
-        # This is a basic version - full YIN is more complex
-
-        buffer_size = len(audio_data)
-        yin_buffer = np.zeros(buffer_size // 2)
-
-        # Step 1: Autocorrelation
-        for lag in range(1, buffer_size // 2):
-            for i in range(buffer_size // 2):
-                if i + lag < buffer_size:
-                    yin_buffer[lag] += (audio_data[i] - audio_data[i + lag]) ** 2
-
-        # Step 2: Cumulative mean normalized difference
-        yin_buffer[0] = 1.0
-        running_sum = 0.0
-
-        for lag in range(1, buffer_size // 2):
-            running_sum += yin_buffer[lag]
-            if running_sum == 0:
-                yin_buffer[lag] = 1.0
-            else:
-                yin_buffer[lag] *= lag / running_sum
+        n = len(audio_data)
+        tau_min = max(2, int(self.sample_rate / self.max_freq))
+        tau_max = int(np.ceil(self.sample_rate / self.min_freq))
+        if n // 2 < tau_max:
+            # Lags beyond half the chunk leave too little overlap to compare
+            if not self._short_window_warned:
+                self._short_window_warned = True
+                logger.warning(
+                    f"YIN needs {2 * tau_max} samples to reach {self.min_freq} Hz "
+                    f"but got {n}; pitches below "
+                    f"{self.sample_rate / (n // 2):.1f} Hz are not detected"
+                )
+            tau_max = n // 2
+        if tau_max <= tau_min + 1:
+            return None, 0.0
 
-        # Step 3: Find minimum
-        min_lag = np.argmin(yin_buffer[1:]) + 1
+        # Difference function d(tau) = sum_j (x[j] - x[j + tau])^2 over a
+        # window of n - tau_max samples, expanded into energy terms and a
+        # cross-correlation computed by FFT
+        x = audio_data.astype(np.float64, copy=False)
+        window = n - tau_max
+        fft_size = self._fft_size(n)
+        cross = irfft(
+            np.conj(rfft(x[:window], fft_size)) * rfft(x, fft_size), fft_size
+        )[: tau_max + 1]
+        energy = np.concatenate(([0.0], np.cumsum(x * x)))
+        lags = np.arange(tau_max + 1)
+        diff = energy[window] + energy[lags + window] - energy[lags] - 2.0 * cross
+
+        # Cumulative mean normalization; d'(0) is defined as 1
+        cmndf = np.ones(tau_max + 1)
+        running = np.cumsum(diff[1:])
+        np.divide(diff[1:] * lags[1:], running, out=cmndf[1:], where=running > 0)
+
+        # First dip below the threshold, followed down to its local minimum
+        below = np.flatnonzero(cmndf[tau_min:tau_max] < self.yin_threshold)
+        if len(below):
+            tau = tau_min + int(below[0])
+            while tau + 1 < tau_max and cmndf[tau + 1] < cmndf[tau]:
+                tau += 1
+        else:
+            tau = tau_min + int(np.argmin(cmndf[tau_min:tau_max]))
+
+        # Parabolic interpolation around the dip
+        previous, current, following = cmndf[tau - 1 : tau + 2]
+        curvature = previous - 2.0 * current + following
+        shift = 0.5 * (previous - following) / curvature if curvature > 0 else 0.0
+
+        frequency = float(self.sample_rate) / (tau + shift)
+        if not self.min_freq <= frequency <= self.max_freq:
+            return None, 0.0
+        confidence = float(np.clip(1.0 - current, 0.0, 1.0))
+        return frequency, confidence
 
-        if min_lag > 0:
-            frequency = float(self.sample_rate) / float(min_lag)
-            if self.min_freq <= frequency <= self.max_freq:
-                confidence = 1.0 - float(yin_buffer[min_lag])
-                return frequency, confidence
-        return None, 0.0
+    def _fft_size(self, min_size: int) -> int:
+        """Return the smallest fast real FFT length >= min_size (cached)."""
+        size = self._fft_sizes.get(min_size)
+        if size is None:
+            size = next_fast_len(min_size, real=True)
+            self._fft_sizes[min_size] = size
+        return size
 
     def _fft_pitch(self, audio_data: np.ndarray) -> Tuple[Optional[float], float]:
         """
@@ -228,15 +294,14 @@ class PitchDetector:
             Tuple of (frequency, confidence)
         """
         # Compute FFT
-        fft = np.fft.rfft(audio_data)
-        magnitudes = np.abs(fft)
-        frequencies = np.fft.rfftfreq(len(audio_data), 1.0 / self.sample_rate)
+        magnitudes = np.abs(rfft(audio_data))
 
-        # Find frequency range indices
-        min_idx = np.argmax(frequencies >= self.min_freq)
-        max_idx = np.argmax(frequencies >= self.max_freq)
-        if max_idx == 0:
-            max_idx = len(frequencies) - 1
+        # Bins are evenly spaced, so the first bin at or above each range
+        # limit follows directly from the bin width
+        bin_hz = self.sample_rate / len(audio_data)
+        last_bin = len(magnitudes) - 1
+        min_idx = math.ceil(self.min_freq / bin_hz)
+        max_idx = min(math.ceil(self.max_freq / bin_hz), last_bin)
 
         # Find peak in frequency range
         range_magnitudes = magnitudes[min_idx:max_idx]
@@ -244,7 +309,7 @@ class PitchDetector:
             return None, 0.0
 
         peak_idx = np.argmax(range_magnitudes)
-        frequency = frequencies[min_idx + peak_idx]
+        frequency = (min_idx + peak_idx) * bin_hz
 
         # Calculate confidence as normalized magnitude
         confidence = range_magnitudes[peak_idx] / np.max(magnitudes)
@@ -266,34 +331,30 @@ class PitchDetector:
         """
         # Check for strong harmonics that might indicate octave errors
         try:
-            fft = np.fft.rfft(audio_data)
-            magnitudes = np.abs(fft)
-            frequencies = np.fft.rfftfreq(len(audio_data), 1.0 / self.sample_rate)
+            fft = rfft(audio_data)
+            # Bins are evenly spaced, so the nearest bin to a frequency is a
+            # rounded index; only the few bins compared need magnitudes
+            bins_per_hz = len(audio_data) / self.sample_rate
+            last_bin = len(fft) - 1
+            orig_mag = abs(fft[min(round(frequency * bins_per_hz), last_bin)])
 
             # Check octave below (half frequency)
             half_freq = frequency / 2
             if half_freq >= self.min_freq:
-                half_idx = np.argmin(np.abs(frequencies - half_freq))
-                if half_idx < len(magnitudes):
-                    # Find the original frequency index
-                    orig_idx = np.argmin(np.abs(frequencies - frequency))
-
-                    # If the lower octave has significantly higher magnitude,
-                    # it's likely the fundamental
-                    if magnitudes[half_idx] > magnitudes[orig_idx] * 1.5:
-                        return half_freq
+                half_idx = min(round(half_freq * bins_per_hz), last_bin)
+                # If the lower octave has significantly higher magnitude,
+                # it's likely the fundamental
+                if abs(fft[half_idx]) > orig_mag * 1.5:
+                    return half_freq
 
             # Check octave above (double frequency)
             double_freq = frequency * 2
             if double_freq <= self.max_freq:
-                double_idx = np.argmin(np.abs(frequencies - double_freq))
-                if double_idx < len(magnitudes):
-                    orig_idx = np.argmin(np.abs(frequencies - frequency))
-
-                    # If the higher octave has much higher magnitude,
-                    # the detected frequency might be a subharmonic
-                    if magnitudes[double_idx] > magnitudes[orig_idx] * 2.0:
-                        return double_freq
+                double_idx = min(round(double_freq * bins_per_hz), last_bin)
+                # If the higher octave has much higher magnitude,
+                # the detected frequency might be a subharmonic
+                if abs(fft[double_idx]) > orig_mag * 2.0:
+                    return double_freq
 
             return frequency
 
@@ -394,9 +455,9 @@ class PitchDetector:
             List of (frequency, magnitude) tuples for harmonics
         """
         try:
-            fft = np.fft.rfft(audio_data)
-            magnitudes = np.abs(fft)
-            frequencies = np.fft.rfftfreq(len(audio_data), 1.0 / self.sample_rate)
+            spectrum = rfft(audio_data)
+            bins_per_hz = len(audio_data) / self.sample_rate
+            last_bin = len(spectrum) - 1
 
             harmonics = []
 
@@ -407,9 +468,8 @@ class PitchDetector:
                     break
 
                 # Find closest frequency bin
-                idx = np.argmin(np.abs(frequencies - harmonic_freq))
-                if idx < len(magnitudes):
-                    harmonics.append((harmonic_freq, magnitudes[idx]))
+                idx = min(round(harmonic_freq * bins_per_hz), last_bin)
+                harmonics.append((harmonic_freq, abs(spectrum[idx])))
 
             return harmonics
 
@@ -6,10 +6,16 @@ including logging setup, validation, and mathematical helpers.
 """
 
 import logging
+import math
 import sys
 from typing import Optional
 
-import numpy as np
+_PITCH_CLASS_NAMES = ("C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B")
+
+# Names of all 128 MIDI notes, built once so lookups do not format strings
+_MIDI_NOTE_NAMES = tuple(
+    f"{_PITCH_CLASS_NAMES[note % 12]}{note // 12 - 1}" for note in range(128)
+)
 
 
 def setup_logging(level: str = "INFO", format_string: Optional[str] = None) -> None:
@@ -63,14 +69,60 @@ def frequency_to_midi_note(frequency: float, transpose: int = 0) -> int:
     if frequency <= 0:
         raise ValueError("Frequency must be positive")
 
-    # Calculate MIDI note using A4 = 440 Hz as reference (MIDI note 69)
-    midi_note = int(round(12 * np.log2(frequency / 440) + 69))
+    # Calculate MIDI note using A4 = 440 Hz as reference (MIDI note 69);
+    # math.log2 avoids NumPy ufunc dispatch for a single scalar
+    midi_note = int(round(12 * math.log2(frequency / 440) + 69))
     midi_note += transpose
 
     # Clamp to valid MIDI range
     return max(0, min(127, midi_note))
 
 
+def pitch_decimation_factor(
+    sample_rate: float, max_freq: float, max_factor: int = 8, headroom: float = 8.0
+) -> int:
+    """
+    Choose how far audio can be downsampled before pitch detection.
+
+    Args:
+        sample_rate: Capture sample rate in Hz
+        max_freq: Highest pitch to detect in Hz
+        max_factor: Largest decimation factor to return
+        headroom: Minimum ratio of the decimated sample rate to max_freq, so
+            the first few harmonics are kept
+
+    Returns:
+        Power-of-two decimation factor (1 if no downsampling is possible)
+    """
+    factor = 1
+    while (
+        factor * 2 <= max_factor and sample_rate / (factor * 2) >= headroom * max_freq
+    ):
+        factor *= 2
+    return factor
+
+
+def pitch_analysis_size(
+    sample_rate: float, min_freq: float, decimation: int = 1
+) -> int:
+    """
+    Input samples needed to detect pitches down to min_freq.
+
+    YIN compares the signal with itself shifted by up to one period, so the
+    analysis window must span two periods of the lowest pitch once
+    decimated.
+
+    Args:
+        sample_rate: Capture sample rate in Hz
+        min_freq: Lowest pitch to detect in Hz
+        decimation: Decimation factor applied before pitch detection
+
+    Returns:
+        Number of input samples (a multiple of decimation)
+    """
+    return 2 * math.ceil(sample_rate / decimation / min_freq) * decimation
+
+
 def frequency_to_note_name(frequency: float, transpose: int = 0) -> str:
     """
     Convert frequency to note name.
@@ -102,10 +154,7 @@ def midi_note_to_name(note_number: int) -> str:
     if not (0 <= note_number <= 127):
         return "None"
 
-    note_names = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-    octave = (note_number // 12) - 1
-    note_name = note_names[note_number % 12]
-    return f"{note_name}{octave}"
+    return _MIDI_NOTE_NAMES[note_number]
 
 
 def validate_midi_range(note: int, min_note: int = 0, max_note: int = 127) -> bool:
@@ -163,7 +212,7 @@ def linear_to_db(linear: float) -> float:
     """
     if linear <= 0:
         return -float("inf")
-    return float(20 * np.log10(linear))
+    return 20 * math.log10(linear)
 
 
 def smooth_value(current: float, target: float, smoothing: float = 0.1) -> float:
@@ -0,0 +1,90 @@
+"""Tests for audio preprocessing."""
+
+import numpy as np
+import pytest
+
+from audio_to_midi.utils.helpers import pitch_analysis_size, pitch_decimation_factor
+
+
+def test_pitch_decimation_factor_keeps_headroom():
+    assert pitch_decimation_factor(44100, 800.0) == 4
+    assert pitch_decimation_factor(8000, 800.0) == 1
+
+
+def test_pitch_analysis_size_spans_two_periods_of_min_freq():
+    # 80 Hz at 11025 Hz is a 138-sample period once decimated by 4
+    assert pitch_analysis_size(44100, 80.0, 4) == 2 * 138 * 4
+    assert pitch_analysis_size(44100, 80.0) == 1104
+
+
+def test_decimation_is_continuous_across_uneven_chunks():
+    # The audio package imports PyAudio, which needs the PortAudio library
+    pytest.importorskip("pyaudio")
+    from audio_to_midi.audio.processor import AudioProcessor
+
+    processor = AudioProcessor()
+    processor.configure(sample_rate=44100, decimation=4, window_type="none")
+    chunks = np.random.default_rng(0).standard_normal(3000).astype(np.float32)
+
+    lengths = [len(processor.process(chunk)) for chunk in np.split(chunks, 3)]
+    assert sum(lengths) == 750
+    assert processor.output_sample_rate == 11025
+
+
+def test_is_silent_uses_peak_of_either_sign():
+    pytest.importorskip("pyaudio")
+    from audio_to_midi.audio.processor import AudioProcessor
+
+    processor = AudioProcessor()
+    processor.configure(sample_rate=44100, silence_threshold=0.01)
+    quiet = np.full(1024, 0.005, dtype=np.float32)
+
+    assert processor.is_silent(quiet)
+    quiet[10] = -0.02
+    assert not processor.is_silent(quiet)
+
+
+def test_none_window_returns_input_unchanged():
+    pytest.importorskip("pyaudio")
+    from audio_to_midi.audio.processor import AudioProcessor
+
+    processor = AudioProcessor()
+    processor.configure(sample_rate=44100, window_type="none", apply_high_pass=False)
+    chunk = np.arange(8, dtype=np.float32)
+
+    assert processor.process(chunk) is chunk
+
+
+def test_analysis_window_overlaps_successive_chunks():
+    pytest.importorskip("pyaudio")
+    from audio_to_midi.audio.processor import AudioProcessor
+
+    processor = AudioProcessor()
+    processor.configure(
+        sample_rate=44100, window_type="none", apply_high_pass=False, analysis_size=8
+    )
+    chunks = np.arange(1, 13, dtype=np.float32).reshape(3, 4)
+
+    assert processor.process(chunks[0]).tolist() == [0, 0, 0, 0, 1, 2, 3, 4]
+    assert processor.process(chunks[1]).tolist() == [1, 2, 3, 4, 5, 6, 7, 8]
+    assert processor.process(chunks[2]).tolist() == [5, 6, 7, 8, 9, 10, 11, 12]
+
+    processor.clear_history()
+    assert processor.process(chunks[0]).tolist() == [0, 0, 0, 0, 1, 2, 3, 4]
+
+
+def test_clear_history_resets_filter_state():
+    pytest.importorskip("pyaudio")
+    from audio_to_midi.audio.processor import AudioProcessor
+
+    noise = np.random.default_rng(1).standard_normal(1023).astype(np.float32)
+    onset = np.sin(np.arange(1024) / 10).astype(np.float32)
+    outputs = []
+    for warmup in (noise, np.zeros_like(noise)):
+        processor = AudioProcessor()
+        processor.configure(sample_rate=44100, decimation=4, analysis_size=2048)
+        processor.process(warmup)
+        processor.clear_history()
+        outputs.append(processor.process(onset))
+
+    np.testing.assert_array_equal(outputs[0], outputs[1])
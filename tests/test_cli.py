@@ -0,0 +1,19 @@
+"""Tests for CLI option parsing."""
+
+from click.testing import CliRunner
+
+from audio_to_midi.cli.commands import cli
+
+
+def test_run_rejects_unsupported_chunk_size():
+    """Test that --chunk-size only accepts the supported sizes."""
+    result = CliRunner().invoke(cli, ["run", "--chunk-size", "300"])
+    assert result.exit_code == 2
+    assert "300 is not one of 512, 1024, 2048, 4096" in result.output
+
+
+def test_run_rejects_out_of_range_confidence():
+    """Test that --confidence is limited to 0.0-1.0."""
+    result = CliRunner().invoke(cli, ["run", "--confidence", "1.5"])
+    assert result.exit_code == 2
+    assert "--confidence" in result.output
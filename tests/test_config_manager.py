@@ -0,0 +1,63 @@
+"""Tests for configuration loading and saving."""
+
+import os
+import stat
+
+import pytest
+
+from audio_to_midi.config.manager import ConfigManager, load_settings
+
+
+def test_save_and_load_round_trip(tmp_path):
+    """Test that saved settings are loaded back unchanged."""
+    config_path = str(tmp_path / "config.json")
+    manager = ConfigManager(config_path)
+    settings = manager.load()
+    settings.audio.chunk_size = 2048
+    settings.midi.output_port_name = "IAC Driver Bus 1"
+    manager.save()
+
+    assert ConfigManager(config_path).load() == settings
+
+
+def test_cached_load_returns_independent_copies(tmp_path):
+    """Test that mutating a loaded Settings does not leak into later loads."""
+    config_path = str(tmp_path / "config.json")
+    manager = ConfigManager(config_path)
+    manager.load()
+    manager.save()
+
+    first = load_settings(config_path)
+    first.audio.chunk_size = 4096
+
+    assert load_settings(config_path).audio.chunk_size == 1024
+
+
+def test_save_skips_unchanged_file(tmp_path):
+    """Test that saving identical settings does not rewrite the file."""
+    config_path = tmp_path / "config.json"
+    manager = ConfigManager(str(config_path))
+    manager.load()
+    manager.save()
+    first_stat = config_path.stat()
+
+    manager.save()
+
+    assert config_path.stat().st_ino == first_stat.st_ino
+    assert config_path.stat().st_mtime_ns == first_stat.st_mtime_ns
+    assert list(tmp_path.iterdir()) == [config_path]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+def test_save_keeps_file_mode(tmp_path):
+    """Test that rewriting the config file keeps its permissions."""
+    config_path = tmp_path / "config.json"
+    manager = ConfigManager(str(config_path))
+    settings = manager.load()
+    manager.save()
+    config_path.chmod(0o640)
+
+    settings.audio.chunk_size = 2048
+    manager.save()
+
+    assert stat.S_IMODE(config_path.stat().st_mode) == 0o640
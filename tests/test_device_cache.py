@@ -0,0 +1,27 @@
+"""Tests for the shared device enumeration cache."""
+
+from audio_to_midi.devices.cache import DeviceEnumerationCache
+
+
+def test_results_are_reused_until_invalidated():
+    cache = DeviceEnumerationCache(ttl=60.0)
+    calls = []
+
+    def loader():
+        calls.append(None)
+        return ["Built-in Microphone"]
+
+    first = cache.get("pyaudio.input", loader)
+    assert cache.get("pyaudio.input", loader) is first
+    cache.invalidate("pyaudio.input")
+    cache.get("pyaudio.input", loader)
+    cache.get("pyaudio.input", loader, refresh=True)
+    assert len(calls) == 3
+
+
+def test_expired_results_are_enumerated_again():
+    cache = DeviceEnumerationCache(ttl=0.0)
+    calls = []
+    for _ in range(2):
+        cache.get("mido.output", lambda: calls.append(None) or [])
+    assert len(calls) == 2
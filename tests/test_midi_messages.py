@@ -0,0 +1,126 @@
+"""Tests for MIDI message creation."""
+
+import numpy as np
+import pytest
+
+from audio_to_midi.core.exceptions import MidiError
+from audio_to_midi.midi.messages import MidiMessageHandler
+
+
+def test_bulk_note_events_match_single_messages():
+    handler = MidiMessageHandler()
+    events = handler.create_note_events_bulk(
+        np.array([60, 61]), np.array([64, 0]), np.array([0, 3])
+    )
+    assert events.tolist() == [
+        handler.create_note_on(60, 64, 0).bytes(),
+        handler.create_note_off(61, 0, 3).bytes(),
+    ]
+
+
+def test_bulk_note_events_reject_out_of_range_values():
+    with pytest.raises(MidiError, match="event 1"):
+        MidiMessageHandler().create_note_events_bulk(
+            np.array([60, 128]), np.array([64, 64]), np.array([0, 0])
+        )
+
+
+@pytest.mark.parametrize(
+    "notes, channels",
+    [
+        (np.array([60.7, 61.0]), np.array([0, 0])),
+        (np.array([60, 61]), np.array([0.0, 1.0])),
+    ],
+)
+def test_bulk_note_events_reject_non_integer_arrays(notes, channels):
+    with pytest.raises(MidiError):
+        MidiMessageHandler().create_note_events_bulk(
+            notes, np.array([64, 64]), channels
+        )
+
+
+@pytest.mark.parametrize("value", [-8192, 0, 8191])
+def test_pitch_bend_round_trips_through_dict(value):
+    handler = MidiMessageHandler()
+    message = handler.create_pitch_bend(value, channel=2)
+    assert message.pitch == value
+    assert handler.validate_message(message)
+    assert handler.dict_to_message(handler.message_to_dict(message)) == message
+
+
+def test_pitch_bend_rejects_out_of_range_values():
+    with pytest.raises(MidiError):
+        MidiMessageHandler().create_pitch_bend(8192)
+
+
+def test_sysex_accepts_memoryview():
+    handler = MidiMessageHandler()
+    payload = bytearray([0x43, 0x10, 0x7F])
+    message = handler.create_system_exclusive(memoryview(payload))
+    assert message.data == (0x43, 0x10, 0x7F)
+    assert handler.dict_to_message(handler.message_to_dict(message)) == message
+
+
+def test_modified_or_copied_message_is_validated_again():
+    handler = MidiMessageHandler()
+    message = handler.create_note_on(60, 64)
+    assert handler.validate_message(message)
+
+    # mido allows velocity 0 on note_on, the handler does not
+    with pytest.raises(MidiError):
+        handler.validate_message(message.copy(velocity=0, skip_checks=True))
+
+    message.velocity = 0
+    with pytest.raises(MidiError):
+        handler.validate_message(message)
+
+
+def test_default_handler_is_shared():
+    from audio_to_midi.midi import DEFAULT_HANDLER
+
+    assert isinstance(DEFAULT_HANDLER, MidiMessageHandler)
+    assert DEFAULT_HANDLER.create_note_on(60, 64).bytes() == [0x90, 60, 64]
+
+
+@pytest.mark.parametrize("size", [4, 256])
+def test_sysex_rejects_data_bytes_above_7f(size):
+    handler = MidiMessageHandler()
+    payload = bytearray(size)
+    assert handler.create_system_exclusive(payload).data == (0,) * size
+
+    payload[-1] = 0x80
+    with pytest.raises(MidiError):
+        handler.create_system_exclusive(payload)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"type": "note_on", "note": 60.0, "velocity": 100},
+        {"type": "control_change", "control": 7, "value": "64"},
+        {"type": "pitchwheel", "pitch": None},
+    ],
+)
+def test_dict_to_message_rejects_non_integer_values(data):
+    with pytest.raises(MidiError):
+        MidiMessageHandler().dict_to_message(data)
+
+
+def test_numpy_integers_are_accepted_and_range_checked():
+    handler = MidiMessageHandler()
+    message = handler.create_note_on(np.uint8(60), np.int64(64), np.uint8(0))
+    assert message.bytes() == [0x90, 60, 64]
+    assert type(message.note) is int
+
+    row = handler.create_note_events_bulk(np.array([60]), np.array([0]), np.array([2]))[
+        0
+    ]
+    message = handler.dict_to_message(
+        {"type": "note_off", "note": row[1], "velocity": row[2], "channel": 2}
+    )
+    assert message.bytes() == row.tolist()
+
+    with pytest.raises(MidiError):
+        handler.create_note_on(np.uint8(200), 64)
+    with pytest.raises(MidiError):
+        handler.create_control_change(7, np.uint16(300))
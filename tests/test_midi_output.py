@@ -0,0 +1,52 @@
+"""Tests for MIDI output."""
+
+from audio_to_midi.midi.output import MidiOutput
+
+
+class RecordingPort:
+    """Output port stand-in that records what was sent."""
+
+    def __init__(self):
+        self.sent = []
+
+    def send(self, message):
+        # Real mido ports send a copy as well
+        self.sent.append(message.copy())
+
+    def close(self):
+        pass
+
+
+def connected_output():
+    output = MidiOutput()
+    output.configure(port_name="Test Port", channel=2, velocity=90)
+    output._output_port = RecordingPort()
+    output._is_connected = True
+    return output
+
+
+def test_reused_messages_carry_each_note():
+    output = connected_output()
+    output.send_note_on(60)
+    output.send_note_on(64, velocity=30)
+    output.send_note_off(60)
+
+    sent = [(m.type, m.note, m.velocity, m.channel) for m in output._output_port.sent]
+    assert sent == [
+        ("note_on", 60, 90, 2),
+        ("note_on", 64, 30, 2),
+        ("note_off", 60, 0, 2),
+    ]
+    assert output.active_notes == {64}
+
+
+def test_retrigger_and_all_notes_off_release_active_notes():
+    output = connected_output()
+    output.send_note_on(60)
+    output.send_note_on(60)
+    output.send_note_on(62)
+
+    assert output.send_all_notes_off()
+    assert output.active_notes == set()
+    offs = sorted(m.note for m in output._output_port.sent if m.type == "note_off")
+    assert offs == [60, 60, 62]
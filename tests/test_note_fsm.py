@@ -0,0 +1,33 @@
+"""Tests for the debounced note state machine."""
+
+from audio_to_midi.config.settings import PitchSettings
+from audio_to_midi.core.note_fsm import NS_PER_SECOND, NoteStateMachine
+
+
+def ns(seconds):
+    return round(seconds * NS_PER_SECOND)
+
+
+def make_fsm():
+    return NoteStateMachine(
+        PitchSettings(
+            debounce_time=0.05, min_note_duration=0.1, silence_release_time=0.1
+        )
+    )
+
+
+def test_note_emitted_once_held_long_enough():
+    fsm = make_fsm()
+    assert fsm.on_pitch(60, ns(0.0)) == (False, None)
+    assert fsm.on_pitch(60, ns(0.06)) == (False, None)
+    assert fsm.on_pitch(60, ns(0.12)) == (True, 60)
+    assert fsm.on_pitch(60, ns(0.2)) == (False, None)
+
+
+def test_note_released_after_silence():
+    fsm = make_fsm()
+    fsm.on_pitch(60, ns(0.0))
+    fsm.on_pitch(60, ns(0.12))
+    assert fsm.on_silence(ns(0.2)) == (False, None)
+    assert fsm.on_silence(ns(0.35)) == (True, None)
+    assert fsm.on_silence(ns(0.5)) == (False, None)
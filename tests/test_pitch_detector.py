@@ -0,0 +1,47 @@
+"""Tests for pitch detection."""
+
+import numpy as np
+import pytest
+
+from audio_to_midi.pitch.detector import PitchDetector
+
+
+def sine(frequency, n=2048, sample_rate=44100):
+    t = np.arange(n) / sample_rate
+    return (0.5 * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+
+@pytest.mark.parametrize("algorithm", ["autocorrelation", "yin"])
+@pytest.mark.parametrize("frequency", [110.0, 220.0, 440.0])
+def test_detects_sine(algorithm, frequency):
+    detector = PitchDetector()
+    detector.configure(algorithm=algorithm)
+    detector.set_smoothing(False)
+    detected, confidence = detector.detect_pitch(sine(frequency))
+    assert detected == pytest.approx(frequency, rel=0.02)
+    assert confidence > 0.5
+
+
+def test_yin_reaches_min_freq_with_two_period_window():
+    # E2, just above the default 80 Hz floor
+    detector = PitchDetector()
+    detector.set_smoothing(False)
+    detected, _ = detector.detect_pitch(sine(82.41, n=1104))
+    assert detected == pytest.approx(82.41, rel=0.02)
+
+
+def test_yin_ignores_strong_second_harmonic():
+    detector = PitchDetector()
+    detector.set_smoothing(False)
+    audio = sine(110.0) * 0.5 + sine(220.0)
+    detected, _ = detector.detect_pitch(audio)
+    assert detected == pytest.approx(110.0, rel=0.01)
+
+
+def test_autocorrelation_resolves_between_integer_lags():
+    # 441 Hz and 436.6 Hz are adjacent integer lags at 44.1 kHz
+    detector = PitchDetector()
+    detector.configure(algorithm="autocorrelation")
+    detector.set_smoothing(False)
+    detected, _ = detector.detect_pitch(sine(438.0))
+    assert detected == pytest.approx(438.0, abs=0.5)
@@ -0,0 +1,53 @@
+"""Tests for the single-producer/single-consumer ring buffer."""
+
+import threading
+
+import pytest
+
+from audio_to_midi.core.ringbuffer import SPSCRing
+
+
+def test_push_pop_preserves_order():
+    ring = SPSCRing(3)
+    assert all(ring.try_push(i) for i in (1, 2, 3))
+    assert not ring.try_push(4)
+    assert [ring.try_pop() for _ in range(4)] == [1, 2, 3, None]
+
+
+def test_pop_times_out_when_empty():
+    assert SPSCRing(1).pop(timeout=0.01) is None
+
+
+def test_pop_wakes_on_push_from_other_thread():
+    ring = SPSCRing(8)
+    received = []
+
+    def consume():
+        while len(received) < 100:
+            item = ring.pop(timeout=1.0)
+            if item is not None:
+                received.append(item)
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    for i in range(100):
+        while not ring.try_push(i):
+            pass
+    consumer.join(timeout=5.0)
+    assert received == list(range(100))
+
+
+def test_close_wakes_untimed_pop():
+    ring = SPSCRing(1)
+    result = []
+    consumer = threading.Thread(target=lambda: result.append(ring.pop()))
+    consumer.start()
+    ring.close()
+    consumer.join(timeout=5.0)
+    assert not consumer.is_alive()
+    assert result == [None]
+
+
+def test_rejects_non_positive_capacity():
+    with pytest.raises(ValueError):
+        SPSCRing(0)
@@ -0,0 +1,63 @@
+"""Tests for settings serialization and validation."""
+
+import pytest
+
+from audio_to_midi.config.settings import Settings
+
+
+def test_to_dict_round_trip():
+    """Test that settings survive a to_dict/from_dict round trip."""
+    settings = Settings()
+    settings.audio.chunk_size = 2048
+    settings.midi.output_port_name = "IAC Driver Bus 1"
+    settings.pitch.min_freq = 100.0
+    settings.pedal.message = {"type": "control_change", "control": 64}
+
+    assert Settings.from_dict(settings.to_dict()) == settings
+
+
+def test_from_dict_accepts_integral_floats():
+    """Test that JSON numbers written as floats load like the plain dataclasses."""
+    data = Settings().to_dict()
+    data["audio"]["sample_rate"] = 44100.0
+
+    assert Settings.from_dict(data).audio.sample_rate == 44100
+
+
+def test_to_dict_sections():
+    """Test that to_dict exposes every section and field."""
+    data = Settings().to_dict()
+
+    assert set(data) == {"audio", "midi", "pitch", "pedal"}
+    assert data["audio"]["sample_rate"] == 44100
+    assert data["midi"]["max_midi_note"] == 84
+    assert data["pitch"]["silence_release_time"] == 0.1
+    assert data["pedal"] == {"port": None, "message": None}
+
+
+def test_validate_rejects_invalid_values():
+    """Test that validation rejects out-of-range values."""
+    settings = Settings()
+    settings.midi.channel = 16
+
+    with pytest.raises(ValueError):
+        settings.validate()
+
+
+def test_msgpack_round_trip():
+    """Test that settings survive a to_msgpack/from_msgpack round trip."""
+    msgspec = pytest.importorskip("msgspec")
+    settings = Settings()
+    settings.audio.chunk_size = 2048
+    settings.pedal.message = {"type": "control_change", "control": 64}
+
+    assert Settings.from_msgpack(settings.to_msgpack()) == settings
+
+    data = Settings().to_dict()
+    data["audio"]["sample_rate"] = 44100.0
+    assert (
+        Settings.from_msgpack(msgspec.msgpack.encode(data)).audio.sample_rate == 44100
+    )
+
+    with pytest.raises(ValueError):
+        Settings.from_msgpack(msgspec.msgpack.encode({"midi": {"channel": 99}}))